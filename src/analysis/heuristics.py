@@ -2,39 +2,56 @@
 Heurísticas para inferência de tipos de variáveis.
 """
 import pandas as pd
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Optional, TYPE_CHECKING
+from .statistical_functions import ColumnProfile, build_profile
 
 if TYPE_CHECKING:
     from domain.variable_types.ivariable_type import IVariableType
 
 
-def infer_variable_type_name(series: pd.Series) -> str:
+def infer_variable_type_name(series: pd.Series, profile: Optional[ColumnProfile] = None) -> str:
     """
     Infere o tipo de variável baseado em heurísticas.
 
     Args:
         series: Série de dados
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         Nome do tipo inferido: 'binary', 'discrete', 'continuous', 'nominal', 'ordinal'
     """
-    series_clean = series.dropna()
+    if profile is None:
+        profile = build_profile(series)
+
+    # O resultado fica memorizado no perfil da coluna
+    if profile.type_name is None:
+        profile.type_name = _infer_from_profile(profile)
+
+    return profile.type_name
+
+
+def _infer_from_profile(profile: ColumnProfile) -> str:
+    """Aplica as heurísticas de inferência sobre o perfil da coluna."""
+    series_clean = profile.clean
 
     if series_clean.empty:
         return 'nominal'
 
-    n_unique = series_clean.nunique()
+    n_unique = profile.nunique
 
     # Binária: apenas 2 valores únicos
     if n_unique == 2:
         return 'binary'
 
     # Verifica se é numérico
-    if pd.api.types.is_numeric_dtype(series_clean):
-        # Verifica se todos os valores são inteiros
-        if pd.api.types.is_integer_dtype(series_clean) or (series_clean % 1 == 0).all():
+    if profile.is_numeric:
+        # Verifica se todos os valores são inteiros (build_profiles já calcula em bloco)
+        if profile.integral is None:
+            profile.integral = bool(pd.api.types.is_integer_dtype(series_clean) or (series_clean % 1 == 0).all())
+        if profile.integral:
             # Discreta: inteiros com poucos valores únicos relativos ao tamanho
-            if n_unique < len(series_clean) * 0.05:  # Menos de 5% de valores únicos
+            if n_unique < profile.n * 0.05:  # Menos de 5% de valores únicos
                 return 'discrete'
             # Pode ser discreta mesmo com muitos valores
             return 'discrete'
@@ -47,30 +64,52 @@ def infer_variable_type_name(series: pd.Series) -> str:
     return 'nominal'
 
 
-def infer_variable_type_strategy(series: pd.Series) -> 'IVariableType':
+def infer_variable_type_strategy(series: pd.Series,
+                                 profile: Optional[ColumnProfile] = None) -> 'IVariableType':
     """
     Infere o tipo de variável e retorna a estratégia apropriada.
+    Com o perfil, a inferência usa apenas dtype, contagens e a verificação
+    de inteiros já calculadas, sem percorrer a série.
 
     Args:
         series: Série de dados
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         Instância de IVariableType apropriada
     """
-    # Import lazy para evitar circular imports
-    from domain.variable_types.binary import BinaryType
-    from domain.variable_types.continuous import ContinuousType
-    from domain.variable_types.discrete import DiscreteType
-    from domain.variable_types.nominal import NominalType
-
-    type_name = infer_variable_type_name(series)
-
-    type_map = {
-        'binary': BinaryType,
-        'continuous': ContinuousType,
-        'discrete': DiscreteType,
-        'nominal': NominalType,
-        'ordinal': NominalType,  # Ordinal requer input manual, usa nominal como fallback
-    }
-
-    return type_map[type_name]()
+    return _strategy(infer_variable_type_name(series, profile))
+
+
+@lru_cache(maxsize=None)
+def _strategy(type_name: str) -> 'IVariableType':
+    """
+    Estratégia do tipo inferido. As estratégias inferidas não guardam estado,
+    então uma única instância por tipo é compartilhada entre as colunas.
+    """
+    return _type_map()[type_name]()
+
+
+_TYPE_MAP: Optional[Dict[str, type]] = None
+
+
+def _type_map() -> Dict[str, type]:
+    """Mapa nome inferido -> classe da estratégia, montado uma única vez."""
+    global _TYPE_MAP
+
+    if _TYPE_MAP is None:
+        # Import lazy para evitar circular imports
+        from domain.variable_types.binary import BinaryType
+        from domain.variable_types.continuous import ContinuousType
+        from domain.variable_types.discrete import DiscreteType
+        from domain.variable_types.nominal import NominalType
+
+        _TYPE_MAP = {
+            'binary': BinaryType,
+            'continuous': ContinuousType,
+            'discrete': DiscreteType,
+            'nominal': NominalType,
+            'ordinal': NominalType,  # Ordinal requer input manual, usa nominal como fallback
+        }
+
+    return _TYPE_MAP
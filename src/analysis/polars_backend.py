@@ -0,0 +1,128 @@
+"""
+Backend Polars para as estatísticas numéricas.
+
+Calcula, em um único plano lazy executado em paralelo entre colunas,
+os valores ordenados, os momentos (n, mínimo, máximo, média, variância
+e desvio padrão), a contagem de distintos e a verificação de valores
+inteiros de todas as colunas numéricas. Os resultados preenchem
+os mesmos perfis (ColumnProfile) usados pelas funções de
+statistical_functions, que seguem inalteradas.
+
+Requer o pacote opcional polars (poetry install --extras polars).
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional
+from .statistical_functions import (
+    ColumnProfile,
+    _exact_in,
+    analyze_dataframe as _analyze_profiles,
+    build_profile
+)
+
+
+def _import_polars():
+    """Importa o polars com uma mensagem clara se não estiver instalado."""
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError(
+            "O engine 'polars' requer o pacote polars. "
+            "Instale com: poetry install --extras polars"
+        ) from e
+    return pl
+
+
+def to_polars(dataframe: pd.DataFrame):
+    """
+    Converte um DataFrame pandas para Polars.
+
+    Args:
+        dataframe: DataFrame pandas
+
+    Returns:
+        pl.DataFrame com os mesmos dados (NaN convertidos em null)
+    """
+    pl = _import_polars()
+    return pl.from_pandas(dataframe, rechunk=True)
+
+
+def fill_numeric_profiles(dataframe: pd.DataFrame, profiles: Dict[str, ColumnProfile]):
+    """
+    Preenche valores ordenados, momentos, distintos e valores inteiros
+    das colunas numéricas com Polars.
+
+    Args:
+        dataframe: DataFrame com os dados
+        profiles: Perfis das colunas (modificados no lugar)
+    """
+    pl = _import_polars()
+
+    numeric = [column for column, profile in profiles.items()
+               if profile.is_numeric and profile.n > 0]
+    if not numeric:
+        return
+
+    # Colunas renomeadas pela posição: o Polars só aceita nomes str
+    # (cabeçalhos inteiros de CSV/XLSX sem cabeçalho seriam rejeitados)
+    names = [f'c{i}' for i in range(len(numeric))]
+    frame = dataframe[numeric].astype('float64').set_axis(names, axis=1)
+    lf = to_polars(frame).lazy()
+
+    # Um plano por coluna para os valores ordenados (tamanhos diferentes)
+    # e um plano com momentos, distintos e valores inteiros de todas;
+    # collect_all executa tudo em paralelo
+    sorted_plans = [lf.select(pl.col(name).drop_nulls().sort()) for name in names]
+    moments_plan = lf.select([
+        expr
+        for name in names
+        for expr in (
+            pl.col(name).count().alias(f'{name}__n'),
+            pl.col(name).min().alias(f'{name}__min'),
+            pl.col(name).max().alias(f'{name}__max'),
+            pl.col(name).mean().alias(f'{name}__mean'),
+            pl.col(name).var().alias(f'{name}__var'),
+            pl.col(name).std().alias(f'{name}__std'),
+            pl.col(name).drop_nulls().n_unique().alias(f'{name}__unique'),
+            # Infinitos resultam em NaN no resto (não inteiros), como no backend pandas
+            (pl.col(name) % 1 == 0).all().alias(f'{name}__integral'),
+        )
+    ])
+
+    *sorted_frames, moments = pl.collect_all([*sorted_plans, moments_plan])
+    moments = moments.row(0, named=True)
+
+    for column, name, sorted_frame in zip(numeric, names, sorted_frames):
+        profile = profiles[column]
+        profile.sorted_values = sorted_frame.to_series().to_numpy()
+        profile.integral = bool(moments[f'{name}__integral'])
+        # Inteiros de 64 bits podem perder precisão em float64: contados pelo pandas
+        if _exact_in(profile.clean.dtype, np.float64):
+            profile.unique_count = int(moments[f'{name}__unique'])
+        summary = {key: moments[f'{name}__{key}'] for key in ('n', 'min', 'max', 'mean', 'var', 'std')}
+        # Mesmo comportamento do backend pandas para uma única observação
+        if summary['var'] is None:
+            summary['var'] = summary['std'] = float('nan')
+        profile.summary = summary
+
+
+def analyze_dataframe(dataframe: pd.DataFrame,
+                      profiles: Optional[Dict[str, ColumnProfile]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula tendência central, separatrizes e dispersão de todas as
+    colunas numéricas usando Polars.
+
+    Args:
+        dataframe: DataFrame com os dados
+        profiles: Perfis pré-calculados das colunas (opcional)
+
+    Returns:
+        Dicionário nome da coluna -> medidas, no mesmo formato das funções calc_*
+    """
+    if profiles is None:
+        profiles = {column: build_profile(series) for column, series in dataframe.items()}
+
+    fill_numeric_profiles(dataframe, profiles)
+
+    # Com os perfis preenchidos, as medidas são as mesmas do backend pandas
+    return _analyze_profiles(dataframe, profiles)
@@ -3,60 +3,566 @@ Funções estatísticas puras para cálculo de métricas.
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, Sequence, Tuple
 
+# Probabilidades de todas as separatrizes, calculadas de uma só vez
+_QUARTIS = {'Q1': 0.25, 'Q2': 0.50, 'Q3': 0.75}
+_DECIS = {f'D{i}': i / 10 for i in range(1, 10)}
+_PERCENTIS = {f'P{i}': i / 100 for i in range(10, 100, 10)}
+_SEPARATRIZES = {**_QUARTIS, **_DECIS, **_PERCENTIS}
 
-def calc_frequencies(series: pd.Series, bins: Optional[int] = None) -> pd.DataFrame:
+# Engines disponíveis para o cálculo das estatísticas numéricas
+ENGINES = ('pandas', 'polars')
+
+# Linhas amostradas por coluna na inferência de tipo antes de verificar a coluna inteira
+INFERENCE_SAMPLE_SIZE = 100_000
+
+# Amplitude máxima de inteiros contados diretamente com np.bincount
+_BINCOUNT_MAX_RANGE = 10_000
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Informações de uma coluna calculadas uma única vez e reaproveitadas
+    pelas funções estatísticas (evita dropna/nunique repetidos).
+    """
+    clean: pd.Series
+    kind: str
+    n: int
+    missing: int
+    unique_count: Optional[int] = field(default=None, repr=False, compare=False)
+    sorted_values: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    summary: Optional[Dict[str, float]] = field(default=None, repr=False, compare=False)
+    type_name: Optional[str] = field(default=None, repr=False, compare=False)
+    separatrizes: Optional[Dict[str, float]] = field(default=None, repr=False, compare=False)
+    integral: Optional[bool] = field(default=None, repr=False, compare=False)
+    counts: Optional[Tuple[Any, np.ndarray]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def nunique(self) -> int:
+        """Número de valores distintos (contado na primeira consulta, se ainda não conhecido)."""
+        if self.unique_count is None:
+            self.unique_count = int(self.clean.nunique(dropna=False))
+        return self.unique_count
+
+    @property
+    def is_numeric(self) -> bool:
+        """Indica se a coluna é numérica (bool, inteiro, real ou complexo)."""
+        return self.kind in 'biufc'
+
+
+def drop_missing(series: pd.Series) -> pd.Series:
+    """
+    Remove valores faltantes sem copiar a série quando não há nenhum
+    (series.hasnans é calculado uma vez e guardado pelo pandas).
+
+    Args:
+        series: Série de dados
+
+    Returns:
+        Série sem valores faltantes (a própria série se não houver faltantes)
+    """
+    return series.dropna() if series.hasnans else series
+
+
+def drop_missing_values(series: pd.Series) -> np.ndarray:
+    """
+    Valores não faltantes como array NumPy, com uma única máscara sobre
+    o array (sem criar a série intermediária do dropna()).
+
+    Args:
+        series: Série de dados
+
+    Returns:
+        Array sem valores faltantes (sem cópia se não houver faltantes)
+    """
+    # Tipos de extensão (Int64, string, ...) convertem melhor pela série
+    if not isinstance(series.dtype, np.dtype):
+        return drop_missing(series).to_numpy()
+
+    values = series.to_numpy()
+    if not series.hasnans:
+        return values
+    return values[~pd.isna(values)]
+
+
+def build_profile(series: pd.Series) -> ColumnProfile:
+    """
+    Constrói o perfil de uma coluna com no máximo uma chamada a dropna().
+
+    Args:
+        series: Série de dados
+
+    Returns:
+        ColumnProfile da série
+    """
+    series_clean = drop_missing(series)
+
+    return ColumnProfile(
+        clean=series_clean,
+        kind=series_clean.dtype.kind,
+        n=len(series_clean),
+        missing=len(series) - len(series_clean)
+    )
+
+
+def build_profiles(dataframe: pd.DataFrame, engine: str = 'pandas',
+                   inference_sample: int = INFERENCE_SAMPLE_SIZE) -> Dict[str, ColumnProfile]:
+    """
+    Constrói os perfis de todas as colunas de um DataFrame.
+
+    As colunas numéricas são convertidas e ordenadas em um único bloco
+    (np.sort por coluna), preenchendo os valores ordenados de cada perfil
+    de uma só vez em vez de uma ordenação por coluna.
+
+    Args:
+        dataframe: DataFrame com os dados
+        engine: 'pandas' (NumPy) ou 'polars' para ordenação e momentos das numéricas
+        inference_sample: Tamanho da amostra usada primeiro na verificação de
+            valores inteiros (a coluna inteira só é verificada se a amostra passar)
+
+    Returns:
+        Dicionário nome da coluna -> ColumnProfile
+
+    Raises:
+        ValueError: Se o engine não for suportado
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Engine '{engine}' não suportado. Engines disponíveis: {list(ENGINES)}")
+
+    profiles = {column: build_profile(series) for column, series in dataframe.items()}
+
+    if engine == 'polars':
+        from .polars_backend import fill_numeric_profiles
+        fill_numeric_profiles(dataframe, profiles)
+        return profiles
+
+    # Um bloco por precisão: colunas float32 continuam em float32
+    groups: Dict[type, list] = {}
+    for column, profile in profiles.items():
+        if profile.is_numeric and profile.n > 0:
+            groups.setdefault(_float_dtype([profile.clean.dtype]), []).append(column)
+
+    for dtype, numeric in groups.items():
+        # Ordem Fortran: cada coluna ordenada fica contígua em memória (NaN vão para o fim)
+        block = np.array(dataframe[numeric].to_numpy(dtype=dtype, na_value=np.nan), order='F')
+        block.sort(axis=0)
+        # Verificação de valores inteiros (usada na inferência) e contagem de
+        # distintos vetorizadas para todas as colunas do bloco
+        integral = _integral_columns(block, inference_sample)
+        sizes = np.array([profiles[column].n for column in numeric])
+        distinct = _distinct_counts(block, sizes)
+        for j, column in enumerate(numeric):
+            profile = profiles[column]
+            profile.sorted_values = block[:profile.n, j]
+            profile.integral = bool(integral[j])
+            # Inteiros de 64 bits podem perder precisão em float64: contados pelo pandas
+            if _exact_in(profile.clean.dtype, dtype):
+                profile.unique_count = int(distinct[j])
+
+    return profiles
+
+
+def _distinct_counts(block: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """
+    Conta os valores distintos de cada coluna de um bloco ordenado, comparando
+    vizinhos (sem tabela hash).
+
+    Args:
+        block: Bloco de colunas ordenadas (NaN no fim)
+        sizes: Número de valores não faltantes de cada coluna
+
+    Returns:
+        Array com o número de valores distintos por coluna
+    """
+    # Comparação direta (não np.diff): infinitos iguais vizinhos não são distintos
+    changes = block[1:] != block[:-1]
+    # Considera apenas vizinhos dentro dos valores não faltantes de cada coluna
+    changes &= np.arange(1, block.shape[0])[:, None] < sizes[None, :]
+    return changes.sum(axis=0) + (sizes > 0)
+
+
+def _exact_in(dtype, float_dtype) -> bool:
+    """Indica se todos os valores do dtype são representados exatamente em float_dtype."""
+    if dtype.kind == 'b':
+        return True
+    if dtype.kind == 'f':
+        return dtype.itemsize <= np.dtype(float_dtype).itemsize
+    # Inteiros são exatos se couberem na mantissa (até int16 em float32, até int32 em float64)
+    return dtype.kind in 'iu' and dtype.itemsize * 2 <= np.dtype(float_dtype).itemsize
+
+
+def _integral_columns(block: np.ndarray, sample_size: int) -> np.ndarray:
+    """
+    Verifica, para cada coluna do bloco ordenado, se todos os valores são inteiros.
+
+    Uma amostra estratificada (linhas a passo fixo do bloco ordenado, cobrindo
+    toda a distribuição) é verificada primeiro: basta um valor decimal na amostra
+    para a coluna ser contínua. Só as colunas que passam são verificadas inteiras,
+    então o resultado é sempre exato.
+
+    Args:
+        block: Bloco de colunas ordenadas (NaN no fim)
+        sample_size: Número aproximado de linhas da amostra
+
+    Returns:
+        Array booleano com uma posição por coluna
+    """
+    def all_integral(values: np.ndarray) -> np.ndarray:
+        # Infinitos resultam em NaN no resto (não inteiros), sem aviso
+        with np.errstate(invalid='ignore'):
+            return ((values % 1 == 0) | np.isnan(values)).all(axis=0)
+
+    step = max(1, block.shape[0] // max(1, sample_size))
+    integral = all_integral(block[::step])
+
+    if step > 1 and integral.any():
+        integral[integral] = all_integral(block[:, integral])
+
+    return integral
+
+
+def analyze_dataframe(dataframe: pd.DataFrame,
+                      profiles: Optional[Dict[str, ColumnProfile]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula tendência central, separatrizes e dispersão de todas as
+    colunas numéricas de uma vez.
+
+    Args:
+        dataframe: DataFrame com os dados
+        profiles: Perfis pré-calculados das colunas (opcional)
+
+    Returns:
+        Dicionário nome da coluna -> medidas, no mesmo formato das funções calc_*
+    """
+    if profiles is None:
+        profiles = build_profiles(dataframe)
+
+    results = {}
+    for column, profile in profiles.items():
+        if not profile.is_numeric:
+            continue
+        series = dataframe[column]
+        results[column] = {
+            'tendencia_central': calc_central_tendency(series, profile=profile),
+            'separatrizes': calc_separatrizes(series, profile=profile),
+            'dispersao': calc_dispersion(series, profile=profile)
+        }
+
+    return results
+
+
+def _clean(series: pd.Series, profile: Optional[ColumnProfile]) -> pd.Series:
+    """Retorna a série sem valores faltantes, reaproveitando o perfil se existir."""
+    return profile.clean if profile is not None else drop_missing(series)
+
+
+def _is_numeric(series_clean: pd.Series, profile: Optional[ColumnProfile]) -> bool:
+    """Verifica se a série é numérica, reaproveitando o perfil se existir."""
+    return profile.is_numeric if profile is not None else pd.api.types.is_numeric_dtype(series_clean)
+
+
+def _float_dtype(dtypes) -> type:
+    """float32 se todas as colunas já forem float32 (dados reduzidos), senão float64."""
+    return np.float32 if all(dtype == np.float32 for dtype in dtypes) else np.float64
+
+
+def _sorted_values(series_clean: pd.Series, profile: Optional[ColumnProfile]) -> np.ndarray:
+    """
+    Retorna os valores numéricos ordenados como float64 (ou float32 se a coluna for float32).
+    A ordenação é feita uma única vez e guardada no perfil, se existir.
+    """
+    if profile is not None and profile.sorted_values is not None:
+        return profile.sorted_values
+
+    values = np.sort(series_clean.to_numpy(dtype=_float_dtype([series_clean.dtype])))
+
+    if profile is not None:
+        profile.sorted_values = values
+
+    return values
+
+
+def _quantiles(sorted_values: np.ndarray, probs: Sequence[float]) -> np.ndarray:
+    """
+    Calcula quantis por interpolação linear sobre um array já ordenado
+    (mesmo método padrão de pandas/NumPy), sem reordenar os dados.
+
+    Args:
+        sorted_values: Valores ordenados
+        probs: Probabilidades entre 0 e 1
+
+    Returns:
+        Array com os quantis
+    """
+    n = sorted_values.size
+    position = np.asarray(probs, dtype=np.float64) * (n - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    gamma = position - lower
+
+    a = sorted_values[lower]
+    b = sorted_values[upper]
+    diff = b - a
+    # Mesma interpolação de np.quantile (estável para gamma >= 0.5)
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+
+def _separatriz_values(sorted_values: np.ndarray, profile: Optional[ColumnProfile]) -> Dict[str, float]:
+    """
+    Retorna todos os quartis, decis e percentis (rótulo -> valor), calculados
+    em uma única interpolação e guardados no perfil, se existir.
+    Mediana, IQR e separatrizes leem deste mesmo resultado.
+    """
+    if profile is not None and profile.separatrizes is not None:
+        return profile.separatrizes
+
+    values = dict(zip(_SEPARATRIZES, _quantiles(sorted_values, list(_SEPARATRIZES.values())).tolist()))
+
+    if profile is not None:
+        profile.separatrizes = values
+
+    return values
+
+
+def _summarize(sorted_values: np.ndarray) -> Dict[str, float]:
+    """
+    Calcula n, mínimo, máximo, média, variância e desvio padrão
+    a partir de um único array ordenado.
+
+    Args:
+        sorted_values: Valores ordenados
+
+    Returns:
+        Dicionário com as medidas
+    """
+    n = sorted_values.size
+    # Acumula sempre em float64, mesmo para dados float32
+    mean = float(sorted_values.sum(dtype=np.float64) / n)
+
+    if n > 1:
+        deviations = sorted_values - mean
+        if deviations.dtype == np.float64:
+            squares = np.dot(deviations, deviations)
+        else:
+            squares = np.square(deviations).sum(dtype=np.float64)
+        var = float(squares / (n - 1))
+    else:
+        var = float('nan')
+
+    return {
+        'n': n,
+        'min': float(sorted_values[0]),
+        'max': float(sorted_values[-1]),
+        'mean': mean,
+        'var': var,
+        'std': float(np.sqrt(var))
+    }
+
+
+def _numeric_summary(sorted_values: np.ndarray, profile: Optional[ColumnProfile]) -> Dict[str, float]:
+    """
+    Retorna o resumo de _summarize, calculado uma única vez por coluna
+    e guardado no perfil, se existir.
+    """
+    if profile is not None and profile.summary is not None:
+        return profile.summary
+
+    summary = _summarize(sorted_values)
+
+    if profile is not None:
+        profile.summary = summary
+
+    return summary
+
+
+def _count_values(series_clean: pd.Series) -> Tuple[Any, np.ndarray]:
+    """
+    Conta as ocorrências de cada valor, ordenadas pelo valor.
+
+    Categóricos e inteiros com amplitude pequena são contados com np.bincount
+    (sem tabela hash); texto é fatorizado uma vez e contado pelos códigos;
+    os demais tipos usam value_counts.
+
+    Args:
+        series_clean: Série sem valores faltantes
+
+    Returns:
+        Tupla (valores, contagens)
+    """
+    dtype = series_clean.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = series_clean.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(dtype.categories))
+        values = pd.Categorical.from_codes(np.arange(len(dtype.categories)), dtype=dtype)
+        return values, counts
+
+    # uint64 fica de fora: pode não caber em int64
+    if dtype.kind == 'i' or (dtype.kind == 'u' and dtype.itemsize < 8):
+        data = series_clean.to_numpy(dtype=np.int64)
+        low = int(data.min())
+        if int(data.max()) - low < _BINCOUNT_MAX_RANGE:
+            counts = np.bincount(data - low)
+            present = np.flatnonzero(counts)
+            return present + low, counts[present]
+
+    # Texto: fatoriza uma vez (hash) e conta os códigos inteiros
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        codes, uniques = pd.factorize(series_clean, sort=True)
+        return uniques, np.bincount(codes, minlength=len(uniques))
+
+    freq_abs = series_clean.value_counts().sort_index()
+    return freq_abs.index, freq_abs.to_numpy()
+
+
+def _run_counts(sorted_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conta as ocorrências de cada valor pelas sequências de valores iguais
+    de um array já ordenado (sem tabela hash).
+
+    Args:
+        sorted_values: Valores ordenados, sem faltantes
+
+    Returns:
+        Tupla (valores, contagens), ordenadas pelo valor
+    """
+    starts = np.flatnonzero(np.concatenate(([True], sorted_values[1:] != sorted_values[:-1])))
+    counts = np.diff(np.append(starts, sorted_values.size))
+    return sorted_values[starts], counts
+
+
+def _value_counts(series_clean: pd.Series, profile: Optional[ColumnProfile]) -> Tuple[Any, np.ndarray]:
+    """
+    Contagem de valores (_count_values) guardada no perfil, se existir.
+    Frequências e moda leem da mesma contagem.
+
+    Colunas decimais já ordenadas no perfil (mesmo dtype) são contadas
+    sobre o array ordenado, reaproveitando a ordenação das demais medidas.
+    """
+    if profile is not None and profile.counts is not None:
+        return profile.counts
+
+    sorted_values = profile.sorted_values if profile is not None else None
+    if (sorted_values is not None and sorted_values.size
+            and series_clean.dtype.kind == 'f' and sorted_values.dtype == series_clean.dtype):
+        counts = _run_counts(sorted_values)
+    else:
+        counts = _count_values(series_clean)
+
+    if profile is not None:
+        profile.counts = counts
+
+    return counts
+
+
+def _round_label(value: float, precision: int) -> float:
+    """Arredonda a parte fracionária de um limite de classe (como pd.cut)."""
+    if not np.isfinite(value) or value == 0:
+        return value
+    frac, whole = np.modf(value)
+    digits = -int(np.floor(np.log10(abs(frac)))) - 1 + precision if whole == 0 else precision
+    return float(np.around(value, digits))
+
+
+def _histogram(sorted_values: np.ndarray, bins: int, precision: int = 3) -> Tuple[pd.Categorical, np.ndarray]:
+    """
+    Agrupa valores ordenados em classes de mesma largura, fechadas à direita.
+
+    Reproduz os limites e rótulos de pd.cut(series, bins), mas conta cada
+    classe com np.searchsorted sobre o array já ordenado, sem criar um
+    categórico do tamanho dos dados.
+
+    Args:
+        sorted_values: Valores ordenados
+        bins: Número de classes
+        precision: Precisão dos rótulos das classes
+
+    Returns:
+        Tupla (classes, contagens)
+    """
+    low, high = float(sorted_values[0]), float(sorted_values[-1])
+
+    if low == high:
+        low -= 0.001 * abs(low) if low != 0 else 0.001
+        high += 0.001 * abs(high) if high != 0 else 0.001
+        edges = np.linspace(low, high, bins + 1)
+    else:
+        edges = np.linspace(low, high, bins + 1)
+        edges[0] -= (high - low) * 0.001  # 0.1% da amplitude
+
+    # Quantidade de valores <= cada limite; a diferença é a contagem de (a, b]
+    counts = np.diff(np.searchsorted(sorted_values, edges, side='right'))
+
+    # Aumenta a precisão dos rótulos até que os limites sejam distintos
+    for digits in range(precision, 20):
+        breaks = [_round_label(edge, digits) for edge in edges]
+        if len(set(breaks)) == len(breaks):
+            break
+    else:
+        breaks = [_round_label(edge, precision) for edge in edges]
+
+    intervals = pd.IntervalIndex.from_breaks(breaks, closed='right')
+    classes = pd.Categorical.from_codes(np.arange(bins), categories=intervals, ordered=True)
+
+    return classes, counts
+
+
+def calc_frequencies(series: pd.Series, bins: Optional[int] = None,
+                     profile: Optional[ColumnProfile] = None) -> pd.DataFrame:
     """
     Calcula frequências absoluta, relativa e acumulada.
 
     Args:
         series: Série de dados
         bins: Número de intervalos para agrupar dados contínuos (opcional)
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         DataFrame com colunas: valor, freq_absoluta, freq_relativa, freq_acumulada
     """
-    series_clean = series.dropna()
+    series_clean = _clean(series, profile)
 
     if series_clean.empty:
         return pd.DataFrame(columns=['valor', 'freq_absoluta', 'freq_relativa', 'freq_acumulada'])
 
-    # Se bins for especificado, agrupa dados contínuos
-    if bins and pd.api.types.is_numeric_dtype(series_clean):
-        series_clean = pd.cut(series_clean, bins=bins)
-
-    # Frequência absoluta
-    freq_abs = series_clean.value_counts().sort_index()
+    # Frequência absoluta (agrupada em classes se bins for especificado)
+    if bins and _is_numeric(series_clean, profile):
+        values, freq_abs = _histogram(_sorted_values(series_clean, profile), bins)
+    else:
+        values, freq_abs = _value_counts(series_clean, profile)
 
     # Frequência relativa
     freq_rel = freq_abs / len(series_clean)
 
     # Frequência acumulada
-    freq_acum = freq_rel.cumsum()
+    freq_acum = np.cumsum(freq_rel)
 
     # Monta DataFrame
     df_freq = pd.DataFrame({
-        'valor': freq_abs.index,
-        'freq_absoluta': freq_abs.values,
-        'freq_relativa': freq_rel.values,
-        'freq_acumulada': freq_acum.values
+        'valor': values,
+        'freq_absoluta': freq_abs,
+        'freq_relativa': freq_rel,
+        'freq_acumulada': freq_acum
     })
 
     return df_freq
 
 
-def calc_central_tendency(series: pd.Series) -> Dict[str, Optional[Any]]:
+def calc_central_tendency(series: pd.Series, profile: Optional[ColumnProfile] = None) -> Dict[str, Optional[Any]]:
     """
     Calcula medidas de tendência central: média, mediana e moda.
 
     Args:
         series: Série de dados
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         Dicionário com média, mediana e moda
     """
-    series_clean = series.dropna()
+    series_clean = _clean(series, profile)
 
     result = {
         'media': None,
@@ -67,33 +573,34 @@ def calc_central_tendency(series: pd.Series) -> Dict[str, Optional[Any]]:
     if series_clean.empty:
         return result
 
-    # Média (apenas para numéricos)
-    if pd.api.types.is_numeric_dtype(series_clean):
-        result['media'] = float(series_clean.mean())
+    is_numeric = _is_numeric(series_clean, profile)
 
-    # Mediana (apenas para numéricos)
-    if pd.api.types.is_numeric_dtype(series_clean):
-        result['mediana'] = float(series_clean.median())
+    # Média e mediana (apenas para numéricos)
+    if is_numeric:
+        values = _sorted_values(series_clean, profile)
+        result['media'] = _numeric_summary(values, profile)['mean']
+        result['mediana'] = _separatriz_values(values, profile)['Q2']
 
-    # Moda (para todos os tipos)
-    moda_values = series_clean.mode()
-    if not moda_values.empty:
-        result['moda'] = moda_values.tolist() if len(moda_values) > 1 else moda_values.iloc[0]
+    # Moda (para todos os tipos), a partir da mesma contagem das frequências
+    values, counts = _value_counts(series_clean, profile)
+    moda_values = values[counts == counts.max()]
+    result['moda'] = moda_values.tolist() if len(moda_values) > 1 else moda_values[0]
 
     return result
 
 
-def calc_separatrizes(series: pd.Series) -> Dict[str, Any]:
+def calc_separatrizes(series: pd.Series, profile: Optional[ColumnProfile] = None) -> Dict[str, Any]:
     """
     Calcula separatrizes: quartis, decis e percentis.
 
     Args:
         series: Série de dados numéricos
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         Dicionário com quartis, decis e percentis
     """
-    series_clean = series.dropna()
+    series_clean = _clean(series, profile)
 
     result = {
         'quartis': {},
@@ -101,42 +608,31 @@ def calc_separatrizes(series: pd.Series) -> Dict[str, Any]:
         'percentis': {}
     }
 
-    if series_clean.empty or not pd.api.types.is_numeric_dtype(series_clean):
+    if series_clean.empty or not _is_numeric(series_clean, profile):
         return result
 
-    # Quartis
-    result['quartis'] = {
-        'Q1': float(series_clean.quantile(0.25)),
-        'Q2': float(series_clean.quantile(0.50)),
-        'Q3': float(series_clean.quantile(0.75))
-    }
-
-    # Decis
-    result['decis'] = {
-        f'D{i}': float(series_clean.quantile(i/10))
-        for i in range(1, 10)
-    }
+    # Quartis, decis e percentis (de 10 em 10) em uma única chamada
+    values = _separatriz_values(_sorted_values(series_clean, profile), profile)
 
-    # Percentis (de 10 em 10)
-    result['percentis'] = {
-        f'P{i}': float(series_clean.quantile(i/100))
-        for i in range(10, 100, 10)
-    }
+    result['quartis'] = {key: values[key] for key in _QUARTIS}
+    result['decis'] = {key: values[key] for key in _DECIS}
+    result['percentis'] = {key: values[key] for key in _PERCENTIS}
 
     return result
 
 
-def calc_dispersion(series: pd.Series) -> Dict[str, Optional[float]]:
+def calc_dispersion(series: pd.Series, profile: Optional[ColumnProfile] = None) -> Dict[str, Optional[float]]:
     """
     Calcula medidas de dispersão.
 
     Args:
         series: Série de dados numéricos
+        profile: Perfil pré-calculado da coluna (opcional)
 
     Returns:
         Dicionário com amplitude, variância, desvio padrão, IQR e coeficiente de variação
     """
-    series_clean = series.dropna()
+    series_clean = _clean(series, profile)
 
     result = {
         'amplitude': None,
@@ -146,27 +642,29 @@ def calc_dispersion(series: pd.Series) -> Dict[str, Optional[float]]:
         'coeficiente_variacao': None
     }
 
-    if series_clean.empty or not pd.api.types.is_numeric_dtype(series_clean):
+    if series_clean.empty or not _is_numeric(series_clean, profile):
         return result
 
+    values = _sorted_values(series_clean, profile)
+    summary = _numeric_summary(values, profile)
+
     # Amplitude
-    result['amplitude'] = float(series_clean.max() - series_clean.min())
+    result['amplitude'] = summary['max'] - summary['min']
 
     # Variância
-    result['variancia'] = float(series_clean.var())
+    result['variancia'] = summary['var']
 
     # Desvio padrão
-    result['desvio_padrao'] = float(series_clean.std())
+    result['desvio_padrao'] = summary['std']
 
     # Intervalo interquartil (Q3 - Q1)
-    q1 = series_clean.quantile(0.25)
-    q3 = series_clean.quantile(0.75)
-    result['intervalo_interquartil'] = float(q3 - q1)
+    separatrizes = _separatriz_values(values, profile)
+    result['intervalo_interquartil'] = separatrizes['Q3'] - separatrizes['Q1']
 
     # Coeficiente de variação (apenas se média != 0)
-    media = series_clean.mean()
+    media = summary['mean']
     if media != 0:
-        result['coeficiente_variacao'] = float((series_clean.std() / media) * 100)
+        result['coeficiente_variacao'] = (summary['std'] / media) * 100
 
     return result
 
@@ -183,10 +681,8 @@ def clean_data(series: pd.Series, remove_duplicates: bool = True, remove_outlier
     Returns:
         Série limpa
     """
-    series_clean = series.copy()
-
-    # Remove valores faltantes
-    series_clean = series_clean.dropna()
+    # Remove valores faltantes (dropna já retorna uma nova série)
+    series_clean = series.dropna() if series.hasnans else series.copy()
 
     # Remove duplicados
     if remove_duplicates:
@@ -194,8 +690,7 @@ def clean_data(series: pd.Series, remove_duplicates: bool = True, remove_outlier
 
     # Remove outliers (apenas para dados numéricos)
     if remove_outliers and pd.api.types.is_numeric_dtype(series_clean):
-        q1 = series_clean.quantile(0.25)
-        q3 = series_clean.quantile(0.75)
+        q1, q3 = series_clean.quantile([0.25, 0.75])
         iqr = q3 - q1
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
@@ -0,0 +1,257 @@
+"""
+Agregação em streaming para arquivos grandes.
+
+Calcula as estatísticas lendo o arquivo em partes (chunks), sem carregar
+todas as linhas na memória:
+- Média, variância, mínimo e máximo com acumuladores (fórmula de Chan)
+- Frequências com contagem incremental (até um limite de categorias)
+- Separatrizes a partir de uma amostra de tamanho fixo (reservoir sampling),
+  exatas enquanto o total de valores couber na amostra
+"""
+import sys
+import pandas as pd
+import numpy as np
+from collections import Counter
+from typing import Dict, Any, Optional
+from .statistical_functions import calc_separatrizes, drop_missing
+
+
+class _ColumnAccumulator:
+    """Acumuladores de uma única coluna."""
+
+    def __init__(self, sample_size: int, max_categories: int, rng: np.random.Generator):
+        self.sample_size = sample_size
+        self.max_categories = max_categories
+        self.rng = rng
+
+        self.n = 0
+        self.missing = 0
+        self.numeric = True
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.counts: Optional[Counter] = Counter()
+        # Alocada na primeira parte numérica (colunas de texto não usam amostra)
+        self.sample: Optional[np.ndarray] = None
+
+    def update(self, series: pd.Series):
+        """
+        Incorpora uma parte da coluna aos acumuladores.
+
+        Args:
+            series: Parte (chunk) da coluna
+        """
+        series_clean = drop_missing(series)
+        self.missing += len(series) - len(series_clean)
+
+        if series_clean.empty:
+            return
+
+        # Frequências (deixa de contar se houver categorias demais)
+        if self.counts is not None:
+            self.counts.update(series_clean.value_counts().to_dict())
+            if len(self.counts) > self.max_categories:
+                self.counts = None
+
+        if self.numeric and not pd.api.types.is_numeric_dtype(series_clean):
+            self.numeric = False
+
+        if self.numeric:
+            values = series_clean.to_numpy(dtype=np.float64)
+            self._update_moments(values)
+            self._update_sample(values)
+
+        self.n += len(series_clean)
+
+    def _update_moments(self, values: np.ndarray):
+        """Combina média/M2 da parte com os acumulados (fórmula de Chan)."""
+        m = values.size
+        chunk_mean = float(values.mean())
+        deviations = values - chunk_mean
+        chunk_m2 = float(np.dot(deviations, deviations))
+
+        total = self.n + m
+        delta = chunk_mean - self.mean
+        self.mean += delta * m / total
+        self.m2 += chunk_m2 + delta * delta * self.n * m / total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def _update_sample(self, values: np.ndarray):
+        """Atualiza a amostra de tamanho fixo (reservoir sampling)."""
+        if self.sample is None:
+            self.sample = np.empty(self.sample_size, dtype=np.float64)
+
+        filled = min(self.n, self.sample_size)
+
+        # Preenche as posições livres da amostra
+        free = self.sample_size - filled
+        if free > 0:
+            head = values[:free]
+            self.sample[filled:filled + head.size] = head
+            values = values[free:]
+
+        if values.size == 0:
+            return
+
+        # Cada novo valor substitui uma posição aleatória com probabilidade k/(i+1)
+        start = self.n + free
+        positions = self.rng.integers(0, np.arange(start, start + values.size) + 1)
+        keep = positions < self.sample_size
+        self.sample[positions[keep]] = values[keep]
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Converte os acumuladores no formato das funções calc_*.
+
+        Returns:
+            Dicionário com as medidas disponíveis para a coluna
+        """
+        result: Dict[str, Any] = {
+            'total_valores': self.n + self.missing,
+            'valores_faltantes': self.missing,
+            'valores_unicos': len(self.counts) if self.counts is not None else None
+        }
+
+        if self.counts is not None and self.counts:
+            result['frequencias'] = self._frequencies()
+
+        if not self.numeric or self.n == 0:
+            if self.counts:
+                result['moda'] = self._mode()
+            return result
+
+        sample = pd.Series(self.sample[:min(self.n, self.sample_size)])
+        separatrizes = calc_separatrizes(sample)
+        quartis = separatrizes['quartis']
+
+        var = self.m2 / (self.n - 1) if self.n > 1 else float('nan')
+        std = float(np.sqrt(var))
+
+        result['tendencia_central'] = {
+            'media': self.mean,
+            'mediana': quartis['Q2'],
+            'moda': self._mode() if self.counts else None
+        }
+        result['separatrizes'] = separatrizes
+        result['dispersao'] = {
+            'amplitude': self.max - self.min,
+            'variancia': var,
+            'desvio_padrao': std,
+            'intervalo_interquartil': quartis['Q3'] - quartis['Q1'],
+            'coeficiente_variacao': (std / self.mean) * 100 if self.mean != 0 else None
+        }
+
+        return result
+
+    def _frequencies(self) -> pd.DataFrame:
+        """Monta a tabela de frequências a partir das contagens."""
+        try:
+            items = sorted(self.counts.items())
+        except TypeError:
+            # Tipos misturados: ordena pela representação textual
+            items = sorted(self.counts.items(), key=lambda item: str(item[0]))
+
+        freq_abs = np.array([count for _, count in items])
+        freq_rel = freq_abs / self.n
+
+        return pd.DataFrame({
+            'valor': [value for value, _ in items],
+            'freq_absoluta': freq_abs,
+            'freq_relativa': freq_rel,
+            'freq_acumulada': np.cumsum(freq_rel)
+        })
+
+    def _mode(self) -> Any:
+        """Moda a partir das contagens (lista se houver empate)."""
+        top = max(self.counts.values())
+        modes = [value for value, count in self.counts.items() if count == top]
+        try:
+            modes.sort()
+        except TypeError:
+            # Tipos misturados entre partes (ex.: número e texto): ordena pela representação textual
+            modes.sort(key=str)
+        return modes if len(modes) > 1 else modes[0]
+
+
+class StreamingAggregator:
+    """
+    Acumula estatísticas de um conjunto de dados lido em partes (chunks).
+    """
+
+    def __init__(self, sample_size: int = 100_000, max_categories: int = 10_000, seed: int = 0):
+        """
+        Inicializa o agregador.
+
+        Args:
+            sample_size: Tamanho da amostra usada para as separatrizes
+            max_categories: Número máximo de valores distintos contados por coluna
+            seed: Semente do gerador aleatório da amostragem
+        """
+        self.sample_size = sample_size
+        self.max_categories = max_categories
+        self.n_rows = 0
+        self._rng = np.random.default_rng(seed)
+        self._columns: Dict[str, _ColumnAccumulator] = {}
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Incorpora uma parte do conjunto de dados.
+
+        Args:
+            chunk: DataFrame com parte das linhas
+        """
+        for column_name in chunk.columns:
+            accumulator = self._columns.get(column_name)
+            if accumulator is None:
+                accumulator = _ColumnAccumulator(self.sample_size, self.max_categories, self._rng)
+                self._columns[column_name] = accumulator
+            accumulator.update(chunk[column_name])
+
+        self.n_rows += len(chunk)
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna as estatísticas acumuladas.
+
+        Returns:
+            Dicionário nome da coluna -> medidas
+        """
+        return {name: accumulator.result() for name, accumulator in self._columns.items()}
+
+    def print_summary(self, name: str = "Dataset"):
+        """
+        Imprime as estatísticas acumuladas (em uma única escrita no stdout).
+
+        Args:
+            name: Nome do conjunto de dados
+        """
+        lines = [
+            f"\n{'='*60}",
+            f"Dataset (streaming): {name}",
+            f"{'='*60}",
+            f"Total de variáveis: {len(self._columns)}",
+            f"Total de registros: {self.n_rows}",
+        ]
+
+        for column_name, result in self.results().items():
+            lines.append(f"\n  • {column_name}")
+            lines.append(f"    - Valores faltantes: {result['valores_faltantes']}")
+            if result['valores_unicos'] is not None:
+                lines.append(f"    - Valores únicos: {result['valores_unicos']}")
+
+            if 'tendencia_central' in result:
+                for key, value in result['tendencia_central'].items():
+                    if value is not None:
+                        lines.append(f"    - {key.capitalize()}: {value}")
+                for key, value in result['dispersao'].items():
+                    if value is not None:
+                        label = key.replace('_', ' ').capitalize()
+                        lines.append(f"    - {label}: {value:.2f}")
+            elif 'moda' in result:
+                lines.append(f"    - Moda: {result['moda']}")
+
+        lines.append(f"\n{'='*60}\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -1,12 +1,28 @@
 """
 Factory para criação de leitores de dados.
 """
+import importlib
+import importlib.util
+import os
+from pathlib import Path
 from typing import Dict, Type
 from .idata_reader import IDataReader
 
 # Registro de leitores disponíveis
 _registry: Dict[str, Type[IDataReader]] = {}
 
+# Módulos com as implementações embutidas (registradas via decorator ao importar)
+_IMPLEMENTATIONS = (
+    '.readers.csv_reader',
+    '.readers.xlsx_reader',
+)
+
+# Variável de ambiente com um diretório opcional de leitores extras (plugins)
+PLUGIN_DIR_ENV = 'DESCSTATS_PLUGIN_DIR'
+
+# Indica se as implementações já foram carregadas
+_loaded = False
+
 
 def register(key: str):
     """
@@ -16,18 +32,20 @@ def register(key: str):
         key: Chave identificadora do tipo de arquivo (ex: 'csv', 'xlsx')
     """
     def decorator(cls: Type[IDataReader]):
-        _registry[key] = cls
+        _registry[key.lower()] = cls
         return cls
     return decorator
 
 
-def create_reader(file_type: str, file_path: str) -> IDataReader:
+def create_reader(file_type: str, file_path: str, **options) -> IDataReader:
     """
     Cria um leitor de dados apropriado para o tipo de arquivo.
+    Carrega as implementações na primeira chamada.
 
     Args:
         file_type: Tipo do arquivo (ex: 'csv', 'xlsx')
         file_path: Caminho do arquivo
+        **options: Opções repassadas ao leitor (ex: downcast_floats=True)
 
     Returns:
         IDataReader: Instância do leitor apropriado
@@ -35,19 +53,54 @@ def create_reader(file_type: str, file_path: str) -> IDataReader:
     Raises:
         ValueError: Se o tipo de arquivo não for suportado
     """
-    if file_type not in _registry:
+    load_implementations()
+
+    reader_class = _registry.get(file_type.lower())
+    if reader_class is None:
         raise ValueError(
             f"Tipo de arquivo '{file_type}' não suportado. "
             f"Tipos disponíveis: {list(_registry.keys())}"
         )
 
-    reader_class = _registry[file_type]
-    return reader_class(file_path)
+    return reader_class(file_path, **options)
 
 
 def load_implementations():
     """
-    Carrega dinamicamente todas as implementações de leitores.
+    Carrega todas as implementações de leitores (apenas uma vez).
+
+    Importa os leitores da tabela fixa _IMPLEMENTATIONS e, se a variável de
+    ambiente DESCSTATS_PLUGIN_DIR estiver definida, os arquivos .py desse diretório.
     """
+    global _loaded
+    if _loaded:
+        return
+
     # Import dos leitores para que sejam registrados via decorator
-    from .readers import csv_reader, xlsx_reader  # noqa: F401
+    for module_name in _IMPLEMENTATIONS:
+        importlib.import_module(module_name, __package__)
+
+    plugin_dir = os.environ.get(PLUGIN_DIR_ENV)
+    if plugin_dir:
+        _load_plugins(Path(plugin_dir))
+
+    _loaded = True
+
+
+def _load_plugins(plugin_dir: Path):
+    """
+    Importa os leitores extras de um diretório de plugins.
+
+    Args:
+        plugin_dir: Diretório com arquivos .py que usam @register
+
+    Raises:
+        ValueError: Se o diretório não existir
+    """
+    if not plugin_dir.is_dir():
+        raise ValueError(f"Diretório de plugins não encontrado: {plugin_dir}")
+
+    for plugin_path in sorted(plugin_dir.glob('*.py')):
+        spec = importlib.util.spec_from_file_location(f"descstats_plugin_{plugin_path.stem}", plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
@@ -2,6 +2,7 @@
 Interface para leitores de dados.
 """
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 
 
@@ -17,3 +18,18 @@ class IDataReader(ABC):
             pd.DataFrame: Dados carregados
         """
         pass
+
+    @staticmethod
+    def downcast_float_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converte colunas float64 para float32, reduzindo pela metade a memória
+        percorrida pelas estatísticas (com perda de precisão após ~7 dígitos).
+
+        Args:
+            df: DataFrame original
+
+        Returns:
+            DataFrame com colunas float32
+        """
+        float_columns = df.select_dtypes('float64').columns
+        return df.astype({column: np.float32 for column in float_columns})
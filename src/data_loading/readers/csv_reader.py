@@ -1,27 +1,49 @@
 """
 Leitor de arquivos CSV.
 """
+import csv
 import pandas as pd
+from typing import Iterator, Optional
 from ..idata_reader import IDataReader
 from ..factory import register
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    # Sem pyarrow, a conversão usa o acessor .str do pandas
+    pa = pc = None
+
+
+# Tamanho da amostra (em bytes) usada para detectar o delimitador
+SNIFF_SAMPLE_SIZE = 65536
+
+# Delimitadores aceitos na detecção
+DELIMITERS = ';,\t|'
+
 
 @register("csv")
 class CSVReader(IDataReader):
     """Leitor de arquivos CSV."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, skip_locale_fix: bool = False, downcast_floats: bool = False):
         """
         Inicializa o leitor CSV.
 
         Args:
             file_path: Caminho do arquivo CSV
+            skip_locale_fix: Não converte vírgulas decimais (use quando o
+                arquivo já usa ponto como separador decimal)
+            downcast_floats: Converte colunas float64 para float32
         """
         self.file_path = file_path
+        self.skip_locale_fix = skip_locale_fix
+        self.downcast_floats = downcast_floats
 
     def read(self) -> pd.DataFrame:
         """
         Lê o arquivo CSV e retorna um DataFrame.
+        Usa o engine pyarrow (parsing multi-thread).
         Converte automaticamente vírgulas em pontos para números decimais.
 
         Returns:
@@ -32,21 +54,19 @@ class CSVReader(IDataReader):
             pd.errors.ParserError: Se houver erro ao parsear o CSV
         """
         try:
-            # Tenta diferentes delimitadores comuns
-            for delimiter in [';', ',', '\t', '|']:
-                try:
-                    df = pd.read_csv(self.file_path, delimiter=delimiter)
-                    # Verifica se foi parseado corretamente (mais de uma coluna)
-                    if len(df.columns) > 1:
-                        # Converte colunas com vírgulas decimais para float
-                        df = self._convert_comma_to_decimal(df)
-                        return df
-                except:
-                    continue
+            delimiter = self._sniff_delimiter()
 
-            # Se nenhum delimitador funcionou, usa o padrão do pandas
-            df = pd.read_csv(self.file_path)
-            df = self._convert_comma_to_decimal(df)
+            if delimiter is not None:
+                df = pd.read_csv(self.file_path, delimiter=delimiter, engine='pyarrow')
+            else:
+                # Se não foi possível detectar o delimitador, usa o padrão do pandas
+                df = pd.read_csv(self.file_path, engine='pyarrow')
+
+            # Converte colunas com vírgulas decimais para float
+            if not self.skip_locale_fix:
+                df = self._convert_comma_to_decimal(df)
+            if self.downcast_floats:
+                df = self.downcast_float_columns(df)
             return df
 
         except FileNotFoundError:
@@ -54,6 +74,60 @@ class CSVReader(IDataReader):
         except Exception as e:
             raise pd.errors.ParserError(f"Erro ao ler CSV: {str(e)}")
 
+    def iter_chunks(self, chunksize: int = 1_000_000) -> Iterator[pd.DataFrame]:
+        """
+        Lê o arquivo CSV em partes, sem carregar todas as linhas na memória.
+
+        Args:
+            chunksize: Número de linhas por parte
+
+        Yields:
+            pd.DataFrame: Parte dos dados do CSV
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            pd.errors.ParserError: Se houver erro ao parsear o CSV
+        """
+        try:
+            delimiter = self._sniff_delimiter()
+            # O engine pyarrow não suporta leitura em partes
+            chunks = pd.read_csv(self.file_path, delimiter=delimiter, chunksize=chunksize, engine='c')
+
+            for chunk in chunks:
+                if not self.skip_locale_fix:
+                    chunk = self._convert_comma_to_decimal(chunk)
+                if self.downcast_floats:
+                    chunk = self.downcast_float_columns(chunk)
+                yield chunk
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo não encontrado: {self.file_path}")
+        except pd.errors.ParserError:
+            raise
+        except Exception as e:
+            raise pd.errors.ParserError(f"Erro ao ler CSV: {str(e)}")
+
+    def _sniff_delimiter(self) -> Optional[str]:
+        """
+        Detecta o delimitador a partir do início do arquivo, sem parsear o arquivo inteiro.
+
+        Returns:
+            Delimitador detectado ou None se não for possível detectar
+        """
+        with open(self.file_path, 'rb') as f:
+            raw = f.read(SNIFF_SAMPLE_SIZE)
+
+        # Descarta a última linha, que pode ter sido cortada pela amostra
+        if len(raw) == SNIFF_SAMPLE_SIZE and b'\n' in raw:
+            raw = raw[:raw.rindex(b'\n')]
+
+        sample = raw.decode('utf-8', errors='ignore')
+
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=DELIMITERS).delimiter
+        except csv.Error:
+            return None
+
     def _convert_comma_to_decimal(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Converte colunas com números no formato brasileiro (vírgula decimal)
@@ -66,12 +140,10 @@ class CSVReader(IDataReader):
             DataFrame com números convertidos
         """
         for col in df.columns:
-            # Verifica se a coluna é object (texto)
+            # Colunas já numéricas são ignoradas; apenas object (texto) é verificada
             if df[col].dtype == 'object':
                 try:
-                    # Tenta converter substituindo vírgula por ponto
-                    # Remove aspas se existirem
-                    converted = df[col].astype(str).str.replace(',', '.', regex=False)
+                    converted = self._replace_decimal_comma(df[col])
                     # Tenta converter para float
                     converted_float = pd.to_numeric(converted, errors='coerce')
 
@@ -86,3 +158,34 @@ class CSVReader(IDataReader):
                     pass
 
         return df
+
+    @staticmethod
+    def _replace_decimal_comma(series: pd.Series) -> pd.Series:
+        """
+        Substitui vírgulas por pontos em uma coluna de texto.
+        Usa pyarrow.compute (busca vetorizada em C++) quando disponível
+        e a coluna contém apenas strings; caso contrário, usa o acessor .str.
+
+        Args:
+            series: Coluna de texto (dtype object)
+
+        Returns:
+            Coluna com vírgulas substituídas (a original se não houver vírgulas)
+        """
+        if pa is not None:
+            try:
+                arr = pa.array(series, type=pa.string(), from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                # Valores que não são texto: usa o caminho do pandas
+                arr = None
+
+            if arr is not None:
+                # Só substitui vírgula por ponto se houver alguma vírgula na coluna
+                if not pc.any(pc.match_substring(arr, ',')).as_py():
+                    return series
+                replaced = pc.replace_substring(arr, pattern=',', replacement='.')
+                return pd.Series(replaced.to_numpy(zero_copy_only=False), index=series.index, name=series.name)
+
+        if series.str.contains(',', regex=False, na=False).any():
+            return series.str.replace(',', '.', regex=False)
+        return series
@@ -10,14 +10,16 @@ from ..factory import register
 class XLSXReader(IDataReader):
     """Leitor de arquivos XLSX."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, downcast_floats: bool = False):
         """
         Inicializa o leitor XLSX.
 
         Args:
             file_path: Caminho do arquivo XLSX
+            downcast_floats: Converte colunas float64 para float32
         """
         self.file_path = file_path
+        self.downcast_floats = downcast_floats
 
     def read(self) -> pd.DataFrame:
         """
@@ -31,8 +33,12 @@ class XLSXReader(IDataReader):
             ValueError: Se houver erro ao ler o arquivo
         """
         try:
-            return pd.read_excel(self.file_path)
+            df = pd.read_excel(self.file_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo não encontrado: {self.file_path}")
         except Exception as e:
             raise ValueError(f"Erro ao ler XLSX: {str(e)}")
+
+        if self.downcast_floats:
+            df = self.downcast_float_columns(df)
+        return df
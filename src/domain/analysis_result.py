@@ -0,0 +1,43 @@
+"""
+Classe AnalysisResult - Resultado da análise de uma variável.
+"""
+import pandas as pd
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    """
+    Resultado das análises de um tipo de variável (Strategy).
+    Medidas que não se aplicam ao tipo ficam como None.
+
+    Também aceita o acesso por chave dos antigos dicionários
+    (result['moda'], 'moda' in result, result.get('moda')).
+    """
+    frequencias: Optional[pd.DataFrame] = None
+    moda: Any = None
+    mediana: Any = None
+    proporcoes: Optional[Dict[str, str]] = None
+    tendencia_central: Optional[Dict[str, Any]] = None
+    separatrizes: Optional[Dict[str, Any]] = None
+    dispersao: Optional[Dict[str, Any]] = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_NAMES and getattr(self, key) is not None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retorna a medida ou default se ela não existir para este tipo."""
+        return getattr(self, key) if key in self else default
+
+    def keys(self):
+        """Nomes das medidas presentes (diferentes de None)."""
+        return [name for name in _FIELD_NAMES if getattr(self, name) is not None]
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(AnalysisResult))
@@ -1,11 +1,89 @@
 """
 Classe DataSet - Gerencia o conjunto de dados e suas variáveis.
 """
+import contextlib
+import io
+import sys
+import numpy as np
 import pandas as pd
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
-from .variable import Variable
+from .variable import Variable, shared_generators
 from analysis.heuristics import infer_variable_type_strategy
+from analysis.statistical_functions import (
+    INFERENCE_SAMPLE_SIZE,
+    build_profiles,
+    calc_central_tendency,
+    calc_dispersion
+)
+
+# Tipos cujas variáveis entram nos boxplots agrupados do dataset
+_NUMERIC_TYPE_NAMES = ('Discreta', 'Contínua')
+
+# Subpasta de cache_dir usada pelo cache de gráficos (o cache só mexe nela)
+CHART_CACHE_SUBDIR = 'descriptive-statistics-charts'
+
+
+def _export_variable(variable: Variable, output_dir: Path, generate_charts: bool, verbose: bool = True,
+                     chart_cache_dir: Optional[Path] = None) -> str:
+    """
+    Gera gráficos e relatório de uma variável (executado em um processo separado).
+
+    Args:
+        variable: Variável a exportar
+        output_dir: Diretório onde salvar gráficos e relatório
+        generate_charts: Se deve gerar gráficos
+        verbose: Se deve incluir mensagens de sucesso (erros são sempre incluídos)
+        chart_cache_dir: Cache persistente dos gráficos (opcional)
+
+    Returns:
+        Mensagens de progresso, impressas pelo processo principal na ordem das variáveis
+    """
+    out = io.StringIO()
+    chart_gen, report_gen = shared_generators(output_dir, chart_cache_dir)
+
+    with contextlib.redirect_stdout(out):
+        chart_paths = []
+        if generate_charts:
+            try:
+                chart_paths = variable.generate_charts(output_dir, chart_gen)
+                if verbose:
+                    print(f"  ✅ {len(chart_paths)} gráfico(s) gerado(s)")
+            except Exception as e:
+                print(f"  ⚠️  Erro ao gerar gráficos: {e}")
+
+        try:
+            variable.export_report(output_dir, chart_paths, report_gen)
+            if verbose:
+                print(f"  ✅ Relatório MD gerado")
+        except Exception as e:
+            print(f"  ⚠️  Erro ao gerar relatório: {e}")
+
+    return out.getvalue()
+
+
+def _summary_chart(output_dir: Path, dataset_name: str, variables_summary: List[Dict[str, Any]],
+                   numeric_values: Dict[str, np.ndarray],
+                   chart_cache_dir: Optional[Path] = None) -> Tuple[Optional[Path], Optional[Path]]:
+    """
+    Gera os gráficos gerais do dataset: o resumo e os boxplots agrupados das
+    variáveis numéricas (executado em um processo separado, junto com os
+    gráficos das variáveis).
+
+    Args:
+        output_dir: Diretório onde salvar os gráficos
+        dataset_name: Nome do dataset
+        variables_summary: Resumo das variáveis
+        numeric_values: Nome -> valores das variáveis numéricas
+        chart_cache_dir: Cache persistente dos gráficos (opcional)
+
+    Returns:
+        Tupla (gráfico resumo, boxplots agrupados)
+    """
+    chart_gen, _ = shared_generators(output_dir, chart_cache_dir)
+    return (chart_gen.generate_summary_chart(dataset_name, variables_summary),
+            chart_gen.generate_grouped_boxplots(numeric_values))
 
 
 class DataSet:
@@ -14,34 +92,84 @@ class DataSet:
     Gerencia uma coleção de objetos Variable.
     """
 
-    def __init__(self, dataframe: pd.DataFrame, name: str = "Dataset"):
+    def __init__(self, dataframe: pd.DataFrame, name: str = "Dataset", engine: str = 'pandas',
+                 optimize_dtypes: bool = True, inference_sample: int = INFERENCE_SAMPLE_SIZE,
+                 verbose: bool = True):
         """
         Inicializa um dataset.
 
         Args:
             dataframe: DataFrame com os dados
             name: Nome do dataset
+            engine: Engine das estatísticas numéricas ('pandas' ou 'polars')
+            optimize_dtypes: Reduz os tipos das colunas (inteiros menores e
+                texto repetitivo como category) antes das análises
+            inference_sample: Linhas amostradas por coluna na inferência de tipo
+            verbose: Imprime análises, resumos e progresso (False em execuções
+                em lote: nada é formatado, apenas erros são impressos)
         """
         self.name = name
-        self.dataframe = dataframe
+        self.dataframe = self._optimize_dtypes(dataframe) if optimize_dtypes else dataframe
+        self.engine = engine
+        self.inference_sample = inference_sample
+        self.verbose = verbose
         self.variables: List[Variable] = []
+        self._by_name: Dict[str, Variable] = {}
 
         self._create_variables()
 
+    @staticmethod
+    def _optimize_dtypes(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reduz a memória percorrida pelas análises sem alterar os valores:
+        - Inteiros para o menor tipo inteiro que comporta os valores
+        - Texto (object) com menos de 50% de valores distintos para category
+        Colunas reais não são alteradas (float32 é opcional nos leitores).
+
+        Args:
+            dataframe: DataFrame original (não é modificado)
+
+        Returns:
+            DataFrame com os tipos reduzidos
+        """
+        optimized = dataframe.copy(deep=False)
+
+        for column in dataframe.columns:
+            series = dataframe[column]
+
+            if series.dtype.kind in 'iu':
+                optimized[column] = pd.to_numeric(series, downcast='integer' if series.dtype.kind == 'i' else 'unsigned')
+            elif series.dtype == 'object' and len(series) > 0:
+                if series.nunique() / len(series) < 0.5:
+                    optimized[column] = series.astype('category')
+
+        return optimized
+
     def _create_variables(self):
         """Cria objetos Variable para cada coluna do DataFrame."""
-        for column_name in self.dataframe.columns:
-            series = self.dataframe[column_name]
+        # Perfis calculados uma vez (numéricas ordenadas em bloco) e
+        # compartilhados por inferência e análises
+        profiles = build_profiles(self.dataframe, engine=self.engine,
+                                  inference_sample=self.inference_sample)
 
-            variable_type = infer_variable_type_strategy(series)
-
-            variable = Variable(
+        self.variables = [
+            Variable(
                 data=series,
                 name=column_name,
-                variable_type=variable_type
+                variable_type=infer_variable_type_strategy(series, profiles[column_name]),
+                profile=profiles[column_name]
             )
+            for column_name, series in self.dataframe.items()
+        ]
+
+        # Mantém a primeira ocorrência em caso de colunas com nome repetido
+        for variable in self.variables:
+            self._by_name.setdefault(variable.name, variable)
 
-            self.variables.append(variable)
+    def _log(self, *args, **kwargs):
+        """print() apenas no modo verbose."""
+        if self.verbose:
+            print(*args, **kwargs)
 
     def get_variable(self, name: str) -> Optional[Variable]:
         """
@@ -53,10 +181,7 @@ class DataSet:
         Returns:
             Variable ou None se não encontrada
         """
-        for variable in self.variables:
-            if variable.name == name:
-                return variable
-        return None
+        return self._by_name.get(name)
 
     def analyze_variable(self, name: str):
         """
@@ -67,20 +192,31 @@ class DataSet:
         """
         variable = self.get_variable(name)
         if variable:
-            variable.print_analysis()
+            if self.verbose:
+                variable.print_analysis()
         else:
             print(f"❌ Variável '{name}' não encontrada.")
 
     def analyze_all_variables(self):
-        """Analisa e imprime os resultados de todas as variáveis."""
-        print(f"\n{'#'*60}")
-        print(f"# ANÁLISE COMPLETA DO DATASET: {self.name}")
-        print(f"# Total de variáveis: {len(self.variables)}")
-        print(f"# Total de registros: {len(self.dataframe)}")
-        print(f"{'#'*60}\n")
-
-        for variable in self.variables:
-            variable.print_analysis()
+        """
+        Analisa e imprime os resultados de todas as variáveis (em uma única escrita no stdout).
+        Fora do modo verbose apenas executa as análises, sem formatar o texto.
+        """
+        if not self.verbose:
+            for variable in self.variables:
+                variable.analyze()
+            return
+
+        parts = [
+            f"\n{'#'*60}\n",
+            f"# ANÁLISE COMPLETA DO DATASET: {self.name}\n",
+            f"# Total de variáveis: {len(self.variables)}\n",
+            f"# Total de registros: {len(self.dataframe)}\n",
+            f"{'#'*60}\n\n",
+        ]
+        parts.extend(variable.format_analysis() for variable in self.variables)
+
+        sys.stdout.write("".join(parts))
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -96,26 +232,68 @@ class DataSet:
             'variaveis': [var.get_summary() for var in self.variables]
         }
 
+    def fast_summary(self) -> pd.DataFrame:
+        """
+        Resumo de todas as variáveis em uma tabela, sem executar as análises
+        completas (frequências, separatrizes) de cada uma.
+
+        As medidas vêm dos perfis compartilhados (valores ordenados em bloco,
+        contagens e momentos calculados uma vez) e ficam guardadas neles,
+        então as análises completas feitas depois reaproveitam o trabalho.
+
+        Returns:
+            DataFrame indexado pelo nome da variável com tipo, total, faltantes,
+            únicos, média, mediana, moda, desvio padrão e amplitude
+        """
+        rows = []
+
+        for variable in self.variables:
+            summary = variable.get_summary()
+            central = calc_central_tendency(variable.data, profile=variable.profile)
+            dispersion = calc_dispersion(variable.data, profile=variable.profile)
+
+            rows.append({
+                'tipo': summary['tipo'],
+                'total_valores': summary['total_valores'],
+                'valores_faltantes': summary['valores_faltantes'],
+                'valores_unicos': summary['valores_unicos'],
+                'media': central['media'],
+                'mediana': central['mediana'],
+                'moda': central['moda'],
+                'desvio_padrao': dispersion['desvio_padrao'],
+                'amplitude': dispersion['amplitude']
+            })
+
+        return pd.DataFrame(rows, index=pd.Index([variable.name for variable in self.variables], name='variavel'))
+
     def print_summary(self):
-        """Imprime um resumo do dataset."""
+        """Imprime um resumo do dataset (em uma única escrita no stdout). Nada é feito fora do modo verbose."""
+        if not self.verbose:
+            return
+
         summary = self.get_summary()
 
-        print(f"\n{'='*60}")
-        print(f"Dataset: {summary['nome']}")
-        print(f"{'='*60}")
-        print(f"Total de variáveis: {summary['total_variaveis']}")
-        print(f"Total de registros: {summary['total_registros']}")
-        print(f"\nVariáveis:")
+        lines = [
+            f"\n{'='*60}",
+            f"Dataset: {summary['nome']}",
+            f"{'='*60}",
+            f"Total de variáveis: {summary['total_variaveis']}",
+            f"Total de registros: {summary['total_registros']}",
+            f"\nVariáveis:",
+        ]
 
         for var in summary['variaveis']:
-            print(f"\n  • {var['nome']} ({var['tipo']})")
-            print(f"    - Total de valores: {var['total_valores']}")
-            print(f"    - Valores faltantes: {var['valores_faltantes']}")
-            print(f"    - Valores únicos: {var['valores_unicos']}")
+            lines.append(f"\n  • {var['nome']} ({var['tipo']})")
+            lines.append(f"    - Total de valores: {var['total_valores']}")
+            lines.append(f"    - Valores faltantes: {var['valores_faltantes']}")
+            lines.append(f"    - Valores únicos: {var['valores_unicos']}")
+
+        lines.append(f"\n{'='*60}\n")
 
-        print(f"\n{'='*60}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def export_all(self, output_base_dir: Path = None, generate_charts: bool = True, generate_pdfs: bool = True) -> Path:
+    def export_all(self, output_base_dir: Path = None, generate_charts: bool = True, generate_pdfs: bool = True,
+                   max_workers: Optional[int] = None, cache_dir: Optional[Path] = None) -> Path:
         """
         Exporta análises completas apenas em PDF com imagens embutidas.
 
@@ -123,14 +301,17 @@ class DataSet:
             output_base_dir: Diretório base para output (padrão: output/)
             generate_charts: Se deve gerar gráficos (padrão: True)
             generate_pdfs: Se deve gerar PDFs dos relatórios (padrão: True)
+            max_workers: Número de processos para gráficos, relatórios e PDFs
+                (padrão: número de CPUs; 1 executa sem processos extras)
+            cache_dir: Diretório onde guardar os gráficos para reaproveitá-los na
+                próxima exportação (opcional; sem ele todo gráfico é renderizado e nada fica guardado).
+                O cache usa apenas a subpasta CHART_CACHE_SUBDIR/<dataset>
 
         Returns:
             Caminho do diretório de output criado
         """
         import tempfile
         import shutil
-        from visualization.chart_generator import ChartGenerator
-        from export.report_generator import ReportGenerator
         from export.pdf_generator import PDFGenerator
 
         # Define diretório de output final
@@ -145,69 +326,103 @@ class DataSet:
         temp_dir = Path(tempfile.mkdtemp(prefix="stats_"))
 
         try:
-            print(f"\n📂 Gerando análises...")
+            self._log(f"\n📂 Gerando análises...")
+
+            # Cache opcional, fora do output (que só recebe os PDFs): gráficos já
+            # gerados para os mesmos dados são reaproveitados na próxima exportação
+            chart_cache_dir = None
+            if cache_dir is not None:
+                chart_cache_dir = Path(cache_dir) / CHART_CACHE_SUBDIR / self.name.replace('.', '_')
+
+            # Geradores criados uma vez (processos filhos herdam as mesmas instâncias)
+            chart_gen, report_gen = shared_generators(temp_dir, chart_cache_dir)
+
+            # Resumo das variáveis (não depende das análises), compartilhado
+            # pelo gráfico e pelo relatório geral
+            variables_summary = [var.get_summary() for var in self.variables]
+            # Valores das variáveis numéricas para os boxplots agrupados
+            numeric_values = {var.name: var.values for var in self.variables
+                              if var.variable_type.name in _NUMERIC_TYPE_NAMES} if generate_charts else {}
+
+            # Gera análises para cada variável no diretório temporário.
+            # Variáveis são independentes: gráficos (matplotlib) e relatórios
+            # são gerados em processos separados, com progresso na ordem original
+            n = len(self.variables)
+            args = (self.variables, [temp_dir] * n, [generate_charts] * n, [self.verbose] * n,
+                    [chart_cache_dir] * n)
+            summary_future = None
+            if max_workers == 1 or len(self.variables) <= 1:
+                logs = map(_export_variable, *args)
+                executor = None
+            else:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+                # Gráfico resumo em paralelo com os gráficos das variáveis
+                if generate_charts:
+                    summary_future = executor.submit(_summary_chart, temp_dir, self.name, variables_summary,
+                                                     numeric_values, chart_cache_dir)
+                logs = executor.map(_export_variable, *args)
+
+            summary_chart_path = grouped_boxplot_path = None
+            try:
+                for i, (variable, log) in enumerate(zip(self.variables, logs), 1):
+                    # Fora do modo verbose, só variáveis com erro aparecem
+                    if self.verbose or log:
+                        print(f"\n[{i}/{n}] Processando: {variable.name}")
+                        print(log, end="")
 
-            # Gera análises para cada variável no diretório temporário
-            for i, variable in enumerate(self.variables, 1):
-                print(f"\n[{i}/{len(self.variables)}] Processando: {variable.name}")
+                # Cache só com as variáveis desta exportação (as demais são apagadas)
+                if generate_charts:
+                    chart_gen.prune_cache(var.safe_name for var in self.variables)
 
-                chart_paths = []
+                # Gera gráfico resumo do dataset
                 if generate_charts:
                     try:
-                        chart_paths = variable.generate_charts(temp_dir)
-                        print(f"  ✅ {len(chart_paths)} gráfico(s) gerado(s)")
+                        if summary_future is not None:
+                            summary_chart_path, grouped_boxplot_path = summary_future.result()
+                        else:
+                            summary_chart_path, grouped_boxplot_path = _summary_chart(
+                                temp_dir, self.name, variables_summary, numeric_values, chart_cache_dir)
+                        self._log(f"\n✅ Gráfico resumo gerado")
                     except Exception as e:
-                        print(f"  ⚠️  Erro ao gerar gráficos: {e}")
-
-                try:
-                    report_path = variable.export_report(temp_dir, chart_paths)
-                    print(f"  ✅ Relatório MD gerado")
-                except Exception as e:
-                    print(f"  ⚠️  Erro ao gerar relatório: {e}")
-
-            # Gera gráfico resumo do dataset
-            summary_chart_path = None
-            if generate_charts:
-                try:
-                    chart_gen = ChartGenerator(temp_dir)
-                    variables_summary = [var.get_summary() for var in self.variables]
-                    summary_chart_path = chart_gen.generate_summary_chart(self.name, variables_summary)
-                    print(f"\n✅ Gráfico resumo gerado")
-                except Exception as e:
-                    print(f"\n⚠️  Erro ao gerar gráfico resumo: {e}")
+                        print(f"\n⚠️  Erro ao gerar gráfico resumo: {e}")
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                # Gráficos prontos: libera a figura do gerador compartilhado
+                chart_gen.close()
 
             # Gera relatório geral
             try:
-                report_gen = ReportGenerator(temp_dir)
-                variables_summary = [var.get_summary() for var in self.variables]
                 general_report = report_gen.generate_dataset_report(
                     self.name,
                     variables_summary,
-                    summary_chart_path
+                    summary_chart_path,
+                    grouped_boxplot_path
                 )
-                print(f"✅ Relatório geral MD gerado")
+                self._log(f"✅ Relatório geral MD gerado")
             except Exception as e:
                 print(f"⚠️  Erro ao gerar relatório geral: {e}")
 
             # Gera PDFs de todos os relatórios Markdown
             if generate_pdfs:
-                print(f"\n📄 Convertendo para PDF com imagens embutidas...")
+                self._log(f"\n📄 Convertendo para PDF com imagens embutidas...")
                 try:
                     pdf_gen = PDFGenerator(final_output_dir)  # PDFs vão direto para output
-                    pdf_files = pdf_gen.generate_all_pdfs(temp_dir)  # Lê MDs do temp
-                    print(f"✅ {len(pdf_files)} PDF(s) gerado(s)")
+                    pdf_files = pdf_gen.generate_all_pdfs(temp_dir, max_workers=max_workers,  # Lê MDs do temp
+                                                          verbose=self.verbose)
+                    self._log(f"✅ {len(pdf_files)} PDF(s) gerado(s)")
                 except Exception as e:
                     print(f"⚠️  Erro ao gerar PDFs: {e}")
 
-            print(f"\n🎉 Exportação concluída!")
-            print(f"📄 PDFs salvos em: {final_output_dir.absolute()}")
-            print(f"💡 Apenas PDFs foram mantidos (com imagens embutidas)\n")
+            self._log(f"\n🎉 Exportação concluída!")
+            self._log(f"📄 PDFs salvos em: {final_output_dir.absolute()}")
+            self._log(f"💡 Apenas PDFs foram mantidos (com imagens embutidas)\n")
 
         finally:
             # Limpa diretório temporário
             try:
                 shutil.rmtree(temp_dir)
-                print(f"🧹 Arquivos temporários removidos")
+                self._log(f"🧹 Arquivos temporários removidos")
             except Exception as e:
                 print(f"⚠️  Aviso: não foi possível remover temporários: {e}")
 
@@ -1,10 +1,64 @@
 """
 Classe Variable - Representa uma variável (coluna) do dataset.
 """
+import io
+import re
+import sys
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
+from .analysis_result import AnalysisResult
 from .variable_types.ivariable_type import IVariableType
+from analysis.statistical_functions import ColumnProfile, build_profile
+
+if TYPE_CHECKING:
+    from visualization.chart_generator import ChartGenerator
+    from export.report_generator import ReportGenerator
+
+# Caracteres que não podem aparecer em nomes de arquivo gerados
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+# Tipo da variável (nome em minúsculas) -> método do ChartGenerator
+_CHART_METHODS = {
+    'nominal': 'generate_for_nominal',
+    'binária': 'generate_for_binary',
+    'discreta': 'generate_for_discrete',
+    'contínua': 'generate_for_continuous',
+}
+
+
+@lru_cache(maxsize=None)
+def _chart_generator_cls() -> type:
+    """ChartGenerator importado na primeira exportação (matplotlib é pesado)."""
+    from visualization.chart_generator import ChartGenerator
+    return ChartGenerator
+
+
+@lru_cache(maxsize=None)
+def _report_generator_cls() -> type:
+    """ReportGenerator importado na primeira exportação."""
+    from export.report_generator import ReportGenerator
+    return ReportGenerator
+
+
+@lru_cache(maxsize=1)
+def shared_generators(output_dir: Path,
+                      chart_cache_dir: Optional[Path] = None) -> Tuple['ChartGenerator', 'ReportGenerator']:
+    """
+    ChartGenerator e ReportGenerator de um diretório, criados uma vez e
+    reaproveitados por todas as variáveis exportadas (também em cada processo).
+
+    Args:
+        output_dir: Diretório onde salvar gráficos e relatórios
+        chart_cache_dir: Cache persistente dos gráficos (opcional)
+
+    Returns:
+        Tupla (ChartGenerator, ReportGenerator)
+    """
+    return (_chart_generator_cls()(output_dir, cache_dir=chart_cache_dir),
+            _report_generator_cls()(output_dir))
 
 
 class Variable:
@@ -13,7 +67,8 @@ class Variable:
     Contém os dados e o tipo de variável (Strategy pattern).
     """
 
-    def __init__(self, data: pd.Series, name: str, variable_type: IVariableType):
+    def __init__(self, data: pd.Series, name: str, variable_type: IVariableType,
+                 profile: Optional[ColumnProfile] = None):
         """
         Inicializa uma variável.
 
@@ -21,11 +76,36 @@ class Variable:
             data: Série de dados pandas
             name: Nome da variável
             variable_type: Tipo da variável (IVariableType)
+            profile: Perfil pré-calculado da coluna (opcional, calculado se omitido)
         """
         self.data = data
         self.name = name
         self.variable_type = variable_type
+        self.profile = profile if profile is not None else build_profile(data)
         self._analysis_result = None
+        self._summary_cache = None
+        self._values = None
+        self._type_key = variable_type.name.lower()
+        # Nome sanitizado para arquivos (espaços e símbolos viram '_')
+        self._safe_name = _UNSAFE_FILENAME_CHARS.sub('_', str(name))
+
+    @property
+    def safe_name(self) -> str:
+        """Nome sanitizado usado nos arquivos de gráficos e relatórios."""
+        return self._safe_name
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Valores não faltantes como array NumPy, extraídos uma única vez
+        (sem cópia quando o dtype permite) para caminhos NumPy sem Series.
+
+        Returns:
+            Array com os valores não faltantes, na ordem original
+        """
+        if self._values is None:
+            self._values = self.profile.clean.to_numpy(copy=False)
+        return self._values
 
     def set_variable_type(self, variable_type: IVariableType):
         """
@@ -36,8 +116,10 @@ class Variable:
         """
         self.variable_type = variable_type
         self._analysis_result = None
+        self._summary_cache = None
+        self._type_key = variable_type.name.lower()
 
-    def analyze(self, force_reanalyze: bool = False) -> Dict[str, Any]:
+    def analyze(self, force_reanalyze: bool = False) -> AnalysisResult:
         """
         Executa análise estatística delegando para o tipo da variável.
 
@@ -45,146 +127,161 @@ class Variable:
             force_reanalyze: Força uma nova análise mesmo se já existir cache
 
         Returns:
-            Dicionário com resultados da análise
+            AnalysisResult com os resultados da análise
         """
-        if self._analysis_result is not None and not force_reanalyze:
-            return self._analysis_result
+        if force_reanalyze:
+            self._analysis_result = None
 
-        print(f"\n{'='*60}")
-        print(f"Variável: {self.name}")
-        print(f"Tipo: {self.variable_type.name}")
-        print(f"{'='*60}")
+        return self._ensure_analyzed()
 
-        self._analysis_result = self.variable_type.analyze(self.data)
+    def _ensure_analyzed(self) -> AnalysisResult:
+        """Retorna a análise guardada, executando-a (sem imprimir) uma única vez."""
+        if self._analysis_result is None:
+            self._analysis_result = self.variable_type.analyze(self.data, profile=self.profile)
 
         return self._analysis_result
 
     def get_summary(self) -> Dict[str, Any]:
         """
-        Retorna um resumo da variável.
+        Retorna um resumo da variável (calculado uma vez e guardado).
 
         Returns:
             Dicionário com informações da variável
         """
-        return {
-            'nome': self.name,
-            'tipo': self.variable_type.name,
-            'total_valores': len(self.data),
-            'valores_faltantes': int(self.data.isna().sum()),
-            'valores_unicos': int(self.data.nunique())
-        }
+        if self._summary_cache is None:
+            self._summary_cache = {
+                'nome': self.name,
+                'tipo': self.variable_type.name,
+                'total_valores': len(self.data),
+                'valores_faltantes': self.profile.missing,
+                'valores_unicos': self.profile.nunique
+            }
+
+        return self._summary_cache
 
     def print_analysis(self):
-        """Imprime a análise de forma formatada."""
-        result = self.analyze()
+        """Imprime a análise de forma formatada (em uma única escrita no stdout)."""
+        sys.stdout.write(self.format_analysis())
+
+    def format_analysis(self) -> str:
+        """
+        Formata a análise da variável como texto, sem imprimir.
+
+        Returns:
+            Texto da análise (cabeçalho, frequências e medidas)
+        """
+        result = self._ensure_analyzed()
+        out = io.StringIO()
+
+        print(f"\n{'='*60}", file=out)
+        print(f"Variável: {self.name}", file=out)
+        print(f"Tipo: {self.variable_type.name}", file=out)
+        print(f"{'='*60}", file=out)
 
         # Frequências
-        if 'frequencias' in result:
-            print("\n📊 Frequências:")
-            print(result['frequencias'].to_string(index=False))
+        if result.frequencias is not None:
+            print("\n📊 Frequências:", file=out)
+            result.frequencias.to_string(buf=out, index=False)
+            out.write("\n")
 
         # Moda (para variáveis categóricas)
-        if 'moda' in result and 'tendencia_central' not in result:
-            print(f"\n📈 Moda: {result['moda']}")
+        if result.moda is not None and result.tendencia_central is None:
+            print(f"\n📈 Moda: {result.moda}", file=out)
 
         # Proporções (para binárias)
-        if 'proporcoes' in result:
-            print("\n📊 Proporções:")
-            for key, value in result['proporcoes'].items():
-                print(f"  {key}: {value}")
+        if result.proporcoes is not None:
+            print("\n📊 Proporções:", file=out)
+            for key, value in result.proporcoes.items():
+                print(f"  {key}: {value}", file=out)
 
         # Mediana (para ordinais)
-        if 'mediana' in result and 'tendencia_central' not in result:
-            print(f"\n📈 Mediana: {result['mediana']}")
+        if result.mediana is not None and result.tendencia_central is None:
+            print(f"\n📈 Mediana: {result.mediana}", file=out)
 
         # Tendência central (para numéricas)
-        if 'tendencia_central' in result:
-            print("\n📈 Tendência Central:")
-            for key, value in result['tendencia_central'].items():
+        if result.tendencia_central is not None:
+            print("\n📈 Tendência Central:", file=out)
+            for key, value in result.tendencia_central.items():
                 if value is not None:
-                    print(f"  {key.capitalize()}: {value}")
+                    print(f"  {key.capitalize()}: {value}", file=out)
 
         # Separatrizes
-        if 'separatrizes' in result:
-            print("\n📏 Separatrizes:")
+        if result.separatrizes is not None:
+            print("\n📏 Separatrizes:", file=out)
 
-            if result['separatrizes'].get('quartis'):
-                print("  Quartis:")
-                for key, value in result['separatrizes']['quartis'].items():
-                    print(f"    {key}: {value:.2f}")
+            if result.separatrizes.get('quartis'):
+                print("  Quartis:", file=out)
+                for key, value in result.separatrizes['quartis'].items():
+                    print(f"    {key}: {value:.2f}", file=out)
 
-            if result['separatrizes'].get('decis'):
-                print("  Decis:")
-                for key, value in result['separatrizes']['decis'].items():
-                    print(f"    {key}: {value:.2f}")
+            if result.separatrizes.get('decis'):
+                print("  Decis:", file=out)
+                for key, value in result.separatrizes['decis'].items():
+                    print(f"    {key}: {value:.2f}", file=out)
 
         # Dispersão
-        if 'dispersao' in result:
-            print("\n📐 Dispersão:")
-            for key, value in result['dispersao'].items():
+        if result.dispersao is not None:
+            print("\n📐 Dispersão:", file=out)
+            for key, value in result.dispersao.items():
                 if value is not None:
                     label = key.replace('_', ' ').capitalize()
-                    print(f"  {label}: {value:.2f}")
+                    print(f"  {label}: {value:.2f}", file=out)
 
-        print(f"\n{'='*60}\n")
+        print(f"\n{'='*60}\n", file=out)
 
-    def generate_charts(self, output_dir: Path) -> List[Path]:
+        return out.getvalue()
+
+    def generate_charts(self, output_dir: Path, generator: Optional['ChartGenerator'] = None) -> List[Path]:
         """
         Gera gráficos para esta variável.
 
         Args:
             output_dir: Diretório onde salvar os gráficos
+            generator: ChartGenerator já criado para output_dir, reaproveitado
+                entre variáveis (opcional, criado se omitido)
 
         Returns:
             Lista de caminhos dos gráficos gerados
         """
-        from visualization.chart_generator import ChartGenerator
-
         # Garante que a análise foi feita
-        result = self.analyze()
-
-        generator = ChartGenerator(output_dir)
-        type_name = self.variable_type.name.lower()
-
-        # Sanitiza o nome da variável para nome de arquivo
-        safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in self.name)
-        safe_name = safe_name.replace(' ', '_')
-
-        if type_name == "nominal":
-            return generator.generate_for_nominal(self.data, safe_name, result)
-        elif type_name == "binária":
-            return generator.generate_for_binary(self.data, safe_name, result)
-        elif type_name == "discreta":
-            return generator.generate_for_discrete(self.data, safe_name, result)
-        elif type_name == "contínua":
-            return generator.generate_for_continuous(self.data, safe_name, result)
-        else:
+        result = self._ensure_analyzed()
+
+        method = _CHART_METHODS.get(self._type_key)
+        if method is None:
             return []
 
-    def export_report(self, output_dir: Path, chart_paths: List[Path] = None) -> Path:
+        if generator is not None:
+            return getattr(generator, method)(self.data, self._safe_name, result)
+
+        # Gerador criado só para esta chamada: libera a figura ao terminar
+        generator = _chart_generator_cls()(output_dir)
+        try:
+            return getattr(generator, method)(self.data, self._safe_name, result)
+        finally:
+            generator.close()
+
+    def export_report(self, output_dir: Path, chart_paths: List[Path] = None,
+                      generator: Optional['ReportGenerator'] = None) -> Path:
         """
         Exporta relatório desta variável.
 
         Args:
             output_dir: Diretório onde salvar o relatório
             chart_paths: Caminhos dos gráficos gerados
+            generator: ReportGenerator já criado para output_dir, reaproveitado
+                entre variáveis (opcional, criado se omitido)
 
         Returns:
             Caminho do relatório gerado
         """
-        from export.report_generator import ReportGenerator
-
         # Garante que a análise foi feita
-        result = self.analyze()
-
-        generator = ReportGenerator(output_dir)
+        result = self._ensure_analyzed()
 
-        # Sanitiza o nome da variável
-        safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in self.name)
-        safe_name = safe_name.replace(' ', '_')
+        if generator is None:
+            generator = _report_generator_cls()(output_dir)
 
         return generator.generate_variable_report(
-            safe_name,
+            self._safe_name,
             self.variable_type.name,
             result,
             chart_paths or []
@@ -2,9 +2,10 @@
 Tipo de variável Binária.
 """
 import pandas as pd
-from typing import Dict, Any
+from typing import Optional
 from .ivariable_type import IVariableType
-from analysis.statistical_functions import calc_frequencies, calc_central_tendency
+from ..analysis_result import AnalysisResult
+from analysis.statistical_functions import ColumnProfile, calc_frequencies, calc_central_tendency
 
 
 class BinaryType(IVariableType):
@@ -16,29 +17,40 @@ class BinaryType(IVariableType):
 
     def is_applicable(self, data: pd.Series) -> bool:
         """Binária tem exatamente 2 valores únicos."""
-        return data.dropna().nunique() == 2
+        dtype = data.dtype
 
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+        # Booleanos (sem faltantes): basta ter ao menos um True e um False
+        if dtype == bool:
+            return bool(data.any()) and not bool(data.all())
+
+        # Categóricos com menos de 2 categorias não precisam ser percorridos
+        if isinstance(dtype, pd.CategoricalDtype) and len(dtype.categories) < 2:
+            return False
+
+        # nunique já ignora faltantes, sem criar a cópia do dropna()
+        return data.nunique(dropna=True) == 2
+
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Análises para variável binária:
         - Frequências
         - Moda
         - Proporções
         """
-        result = {}
-
         # Frequências
-        freq_df = calc_frequencies(data)
-        result['frequencias'] = freq_df
+        freq_df = calc_frequencies(data, profile=profile)
 
         # Moda
-        central_tendency = calc_central_tendency(data)
-        result['moda'] = central_tendency['moda']
+        central_tendency = calc_central_tendency(data, profile=profile)
 
         # Proporções (mesma coisa que freq_relativa, mas mais explícito)
-        result['proporcoes'] = {
-            str(row['valor']): f"{row['freq_relativa']:.2%}"
-            for _, row in freq_df.iterrows()
+        proporcoes = {
+            str(value): f"{freq:.2%}"
+            for value, freq in zip(freq_df['valor'], freq_df['freq_relativa'])
         }
 
-        return result
+        return AnalysisResult(
+            frequencias=freq_df,
+            moda=central_tendency['moda'],
+            proporcoes=proporcoes
+        )
@@ -1,11 +1,14 @@
 """
 Tipo de variável Contínua.
 """
+import math
 import pandas as pd
-import numpy as np
-from typing import Dict, Any
+from typing import Optional
 from .ivariable_type import IVariableType
+from ..analysis_result import AnalysisResult
 from analysis.statistical_functions import (
+    ColumnProfile,
+    build_profile,
     calc_frequencies,
     calc_central_tendency,
     calc_separatrizes,
@@ -13,6 +16,19 @@ from analysis.statistical_functions import (
 )
 
 
+def sturges_bins(n: int) -> int:
+    """
+    Número de classes pela regra de Sturges.
+
+    Args:
+        n: Número de observações
+
+    Returns:
+        Número de classes (10 se não houver observações)
+    """
+    return int(1 + 3.322 * math.log10(n)) if n > 0 else 10
+
+
 class ContinuousType(IVariableType):
     """Variável numérica que pode assumir qualquer valor em um intervalo."""
 
@@ -26,7 +42,7 @@ class ContinuousType(IVariableType):
             return False
         return True
 
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Análises completas para variável contínua:
         - Frequências (com bins para agrupar)
@@ -34,21 +50,28 @@ class ContinuousType(IVariableType):
         - Separatrizes (quartis, decis, percentis)
         - Dispersão (amplitude, variância, desvio padrão, IQR, CV)
         """
-        result = {}
+        # Sem perfil (uso direto da estratégia), cria um para as medidas
+        # abaixo compartilharem a limpeza e a ordenação dos dados
+        if profile is None:
+            profile = build_profile(data)
 
         # Frequências com bins (agrupa valores contínuos em intervalos)
         # Usa regra de Sturges para determinar número de bins
-        n = len(data.dropna())
-        bins = int(1 + 3.322 * np.log10(n)) if n > 0 else 10
-        result['frequencias'] = calc_frequencies(data, bins=bins)
+        bins = sturges_bins(profile.n)
+        frequencias = calc_frequencies(data, bins=bins, profile=profile)
 
         # Tendência central
-        result['tendencia_central'] = calc_central_tendency(data)
+        tendencia_central = calc_central_tendency(data, profile=profile)
 
         # Separatrizes
-        result['separatrizes'] = calc_separatrizes(data)
+        separatrizes = calc_separatrizes(data, profile=profile)
 
         # Dispersão
-        result['dispersao'] = calc_dispersion(data)
+        dispersao = calc_dispersion(data, profile=profile)
 
-        return result
+        return AnalysisResult(
+            frequencias=frequencias,
+            tendencia_central=tendencia_central,
+            separatrizes=separatrizes,
+            dispersao=dispersao
+        )
@@ -1,10 +1,15 @@
 """
 Tipo de variável Discreta.
 """
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Optional
 from .ivariable_type import IVariableType
+from ..analysis_result import AnalysisResult
 from analysis.statistical_functions import (
+    ColumnProfile,
+    build_profile,
+    drop_missing_values,
     calc_frequencies,
     calc_central_tendency,
     calc_separatrizes,
@@ -23,10 +28,20 @@ class DiscreteType(IVariableType):
         """Discreta é numérica e com valores inteiros."""
         if not pd.api.types.is_numeric_dtype(data):
             return False
-        data_clean = data.dropna()
-        return (data_clean % 1 == 0).all() if not data_clean.empty else False
 
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+        values = drop_missing_values(data)
+        if values.size == 0:
+            return False
+
+        # Inteiros e booleanos não precisam de verificação
+        if values.dtype.kind in 'iub':
+            return True
+
+        # np.mod (e não np.floor) para que infinitos não contem como inteiros
+        with np.errstate(invalid='ignore'):
+            return bool(np.equal(np.mod(values, 1), 0).all())
+
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Análises completas para variável discreta:
         - Frequências
@@ -34,18 +49,26 @@ class DiscreteType(IVariableType):
         - Separatrizes (quartis, decis, percentis)
         - Dispersão (amplitude, variância, desvio padrão, IQR, CV)
         """
-        result = {}
+        # Sem perfil (uso direto da estratégia), cria um para as medidas
+        # abaixo compartilharem a limpeza e a ordenação dos dados
+        if profile is None:
+            profile = build_profile(data)
 
         # Frequências
-        result['frequencias'] = calc_frequencies(data)
+        frequencias = calc_frequencies(data, profile=profile)
 
         # Tendência central
-        result['tendencia_central'] = calc_central_tendency(data)
+        tendencia_central = calc_central_tendency(data, profile=profile)
 
         # Separatrizes
-        result['separatrizes'] = calc_separatrizes(data)
+        separatrizes = calc_separatrizes(data, profile=profile)
 
         # Dispersão
-        result['dispersao'] = calc_dispersion(data)
+        dispersao = calc_dispersion(data, profile=profile)
 
-        return result
+        return AnalysisResult(
+            frequencias=frequencias,
+            tendencia_central=tendencia_central,
+            separatrizes=separatrizes,
+            dispersao=dispersao
+        )
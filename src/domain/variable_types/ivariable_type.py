@@ -3,7 +3,9 @@ Interface para tipos de variáveis - Padrão Strategy.
 """
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Dict, Any
+from typing import Optional
+from analysis.statistical_functions import ColumnProfile
+from ..analysis_result import AnalysisResult
 
 
 class IVariableType(ABC):
@@ -16,15 +18,16 @@ class IVariableType(ABC):
         pass
 
     @abstractmethod
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Executa análises estatísticas apropriadas para este tipo de variável.
 
         Args:
             data: Série de dados
+            profile: Perfil pré-calculado da coluna (opcional)
 
         Returns:
-            Dicionário com resultados das análises
+            AnalysisResult com as medidas aplicáveis ao tipo
         """
         pass
 
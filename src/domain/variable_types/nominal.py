@@ -2,9 +2,15 @@
 Tipo de variável Nominal.
 """
 import pandas as pd
-from typing import Dict, Any
+from typing import Optional
 from .ivariable_type import IVariableType
-from analysis.statistical_functions import calc_frequencies, calc_central_tendency
+from ..analysis_result import AnalysisResult
+from analysis.statistical_functions import (
+    ColumnProfile,
+    build_profile,
+    calc_frequencies,
+    calc_central_tendency
+)
 
 
 class NominalType(IVariableType):
@@ -18,19 +24,21 @@ class NominalType(IVariableType):
         """Nominal é aplicável a dados categóricos/texto."""
         return not pd.api.types.is_numeric_dtype(data)
 
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Análises para variável nominal:
         - Frequências (absoluta, relativa, acumulada)
         - Moda
         """
-        result = {}
+        # Sem perfil (uso direto da estratégia), cria um para frequências
+        # e moda compartilharem a mesma contagem
+        if profile is None:
+            profile = build_profile(data)
 
         # Frequências
-        result['frequencias'] = calc_frequencies(data)
+        frequencias = calc_frequencies(data, profile=profile)
 
         # Apenas moda para variáveis nominais
-        central_tendency = calc_central_tendency(data)
-        result['moda'] = central_tendency['moda']
+        central_tendency = calc_central_tendency(data, profile=profile)
 
-        return result
+        return AnalysisResult(frequencias=frequencias, moda=central_tendency['moda'])
@@ -1,10 +1,12 @@
 """
 Tipo de variável Ordinal.
 """
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, List
+from typing import Optional, List
 from .ivariable_type import IVariableType
-from analysis.statistical_functions import calc_frequencies, calc_central_tendency
+from ..analysis_result import AnalysisResult
+from analysis.statistical_functions import ColumnProfile, calc_frequencies, calc_central_tendency
 
 
 class OrdinalType(IVariableType):
@@ -30,34 +32,34 @@ class OrdinalType(IVariableType):
         """
         return self.order is not None
 
-    def analyze(self, data: pd.Series) -> Dict[str, Any]:
+    def analyze(self, data: pd.Series, profile: Optional[ColumnProfile] = None) -> AnalysisResult:
         """
         Análises para variável ordinal:
         - Frequências
         - Moda
         - Mediana (se ordem estiver definida)
         """
-        result = {}
+        codes = None
 
-        # Se ordem foi definida, converte para categórico ordenado
+        # Se ordem foi definida, converte para categórico ordenado (uma única vez)
         if self.order:
-            data = pd.Categorical(data, categories=self.order, ordered=True)
-            data = pd.Series(data)
+            categorical = pd.Categorical(data, categories=self.order, ordered=True)
+            codes = categorical.codes
+            data = pd.Series(categorical)
+            # O perfil se refere aos dados originais, não aos categorizados
+            profile = None
 
         # Frequências
-        result['frequencias'] = calc_frequencies(data)
+        frequencias = calc_frequencies(data, profile=profile)
 
         # Tendência central
-        central_tendency = calc_central_tendency(data)
-        result['moda'] = central_tendency['moda']
-
-        # Mediana para ordinais (posição central na ordem)
-        if self.order and not data.dropna().empty:
-            # Converte para códigos numéricos baseados na ordem
-            data_numeric = pd.Series(pd.Categorical(data, categories=self.order, ordered=True).codes)
-            data_numeric = data_numeric[data_numeric >= 0]  # Remove -1 (NaN)
-            if not data_numeric.empty:
-                median_idx = int(data_numeric.median())
-                result['mediana'] = self.order[median_idx]
-
-        return result
+        central_tendency = calc_central_tendency(data, profile=profile)
+        mediana = None
+
+        # Mediana para ordinais (posição central na ordem), direto nos códigos
+        if codes is not None:
+            valid = codes[codes >= 0]  # Remove -1 (NaN ou fora da ordem)
+            if valid.size > 0:
+                mediana = self.order[int(np.median(valid))]
+
+        return AnalysisResult(frequencias=frequencias, moda=central_tendency['moda'], mediana=mediana)
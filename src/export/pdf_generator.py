@@ -9,10 +9,64 @@ Converte relatórios .md em PDFs profissionais com:
 """
 
 import markdown
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from weasyprint import HTML, CSS
-from typing import Optional
+from typing import Optional, Tuple
 import base64
+import html
+import os
+import re
+
+
+# Extensões do Markdown usadas nos relatórios
+MARKDOWN_EXTENSIONS = [
+    'tables',           # Suporte a tabelas
+    'fenced_code',      # Blocos de código
+    'nl2br',            # Quebras de linha
+    'sane_lists'        # Listas melhoradas
+]
+
+# Esqueleto do documento HTML (o título e o corpo são inseridos entre as partes).
+# Mantido em str, não bytes: o Markdown gera str, a troca das imagens usa uma
+# regex de str e HTML(string=...) recebe o texto; em bytes seria preciso
+# codificar e decodificar o documento inteiro a cada PDF
+_HTML_HEAD_PRE = '<!DOCTYPE html>\n<html lang="pt-BR">\n<head>\n<meta charset="UTF-8">\n<title>'
+_HTML_HEAD_POST = '</title>\n</head>\n<body>\n'
+_HTML_TAIL = '\n</body>\n</html>\n'
+
+# Atributo src das tags <img> geradas pelo Markdown
+_IMG_SRC_RE = re.compile(r'(<img\b[^>]*\bsrc=")([^"]+)(")', re.IGNORECASE)
+
+# Tipo MIME das imagens embutidas, pela extensão
+_MIME_BY_EXT = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml'
+}
+
+
+@lru_cache(maxsize=64)
+def _image_data_uri(img_path: Path, mtime_ns: int) -> str:
+    """
+    Converte uma imagem em data URI base64.
+    Memorizado por (caminho, data de modificação): imagens repetidas entre
+    relatórios (ex.: gráfico resumo) são codificadas uma única vez.
+
+    Args:
+        img_path: Caminho da imagem
+        mtime_ns: Data de modificação (invalida o cache se a imagem mudar)
+
+    Returns:
+        Data URI com a imagem
+    """
+    mime_type = _MIME_BY_EXT.get(img_path.suffix.lower(), 'image/png')
+    # base64 é ASCII: decode('ascii') é mais barato que utf-8
+    img_data = base64.b64encode(img_path.read_bytes()).decode('ascii')
+    return f"data:{mime_type};base64,{img_data}"
 
 
 class PDFGenerator:
@@ -161,16 +215,23 @@ class PDFGenerator:
     }
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, css_string: Optional[str] = None):
         """
         Inicializa o gerador de PDFs.
 
         Args:
             output_dir: Diretório onde os PDFs serão salvos
+            css_string: CSS dos relatórios (opcional, usa REPORT_CSS)
         """
+        if css_string is not None:
+            self.REPORT_CSS = css_string
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Processador Markdown e CSS criados uma vez e reaproveitados em todos os PDFs
+        self._md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        self._css = CSS(string=self.REPORT_CSS)
+
     def _embed_images_in_html(self, html_content: str, md_file_path: Path) -> str:
         """
         Converte referências de imagens relativas em imagens base64 embutidas.
@@ -182,43 +243,37 @@ class PDFGenerator:
         Returns:
             HTML com imagens embutidas em base64
         """
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        for img in soup.find_all('img'):
-            src = img.get('src')
-            if src and not src.startswith(('http://', 'https://', 'data:')):
-                # Caminho relativo - resolver baseado no diretório do .md
-                img_path = md_file_path.parent / src
-
-                if img_path.exists():
-                    # Ler imagem e converter para base64
-                    try:
-                        with open(img_path, 'rb') as img_file:
-                            img_data = base64.b64encode(img_file.read()).decode('utf-8')
-                            # Detectar tipo de imagem
-                            ext = img_path.suffix.lower()
-                            mime_type = {
-                                '.png': 'image/png',
-                                '.jpg': 'image/jpeg',
-                                '.jpeg': 'image/jpeg',
-                                '.gif': 'image/gif',
-                                '.svg': 'image/svg+xml'
-                            }.get(ext, 'image/png')
-
-                            # Substituir src por data URI
-                            img['src'] = f"data:{mime_type};base64,{img_data}"
-                    except Exception as e:
-                        print(f"⚠️  Erro ao embutir imagem {img_path}: {e}")
-
-        return str(soup)
+        if '<img' not in html_content:
+            return html_content
+
+        base_dir = md_file_path.parent
+
+        def embed(match: re.Match) -> str:
+            src = html.unescape(match.group(2))
+            if src.startswith(('http://', 'https://', 'data:')):
+                return match.group(0)
+
+            # Caminho relativo - resolver baseado no diretório do .md
+            img_path = base_dir / src
+            if not img_path.exists():
+                return match.group(0)
+
+            # Ler imagem e converter para data URI base64
+            try:
+                data_uri = _image_data_uri(img_path, img_path.stat().st_mtime_ns)
+            except Exception as e:
+                print(f"⚠️  Erro ao embutir imagem {img_path}: {e}")
+                return match.group(0)
+            return f"{match.group(1)}{data_uri}{match.group(3)}"
+
+        return _IMG_SRC_RE.sub(embed, html_content)
 
     def markdown_to_pdf(
         self,
         md_file_path: Path,
         pdf_file_path: Optional[Path] = None,
-        title: Optional[str] = None
+        title: Optional[str] = None,
+        embed_images: bool = False
     ) -> Path:
         """
         Converte um arquivo Markdown para PDF.
@@ -227,6 +282,9 @@ class PDFGenerator:
             md_file_path: Caminho do arquivo .md
             pdf_file_path: Caminho de saída do PDF (opcional, usa mesmo nome do .md)
             title: Título do documento (opcional, usa nome do arquivo)
+            embed_images: Embute as imagens no HTML como base64 antes da
+                renderização. Por padrão o WeasyPrint lê as imagens direto
+                do disco, relativas ao .md (base_url)
 
         Returns:
             Caminho do arquivo PDF gerado
@@ -239,49 +297,43 @@ class PDFGenerator:
         with open(md_file_path, 'r', encoding='utf-8') as f:
             md_content = f.read()
 
-        # Converte Markdown para HTML
-        md_processor = markdown.Markdown(extensions=[
-            'tables',           # Suporte a tabelas
-            'fenced_code',      # Blocos de código
-            'nl2br',            # Quebras de linha
-            'sane_lists'        # Listas melhoradas
-        ])
-        html_body = md_processor.convert(md_content)
+        # Converte Markdown para HTML (reset limpa o estado do documento anterior)
+        self._md.reset()
+        html_body = self._md.convert(md_content)
 
         # Cria HTML completo com título
         doc_title = title or md_file_path.stem.replace('_', ' ').title()
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="pt-BR">
-        <head>
-            <meta charset="UTF-8">
-            <title>{doc_title}</title>
-        </head>
-        <body>
-            {html_body}
-        </body>
-        </html>
-        """
+        html_content = "".join((_HTML_HEAD_PRE, doc_title, _HTML_HEAD_POST, html_body, _HTML_TAIL))
 
-        # Embute imagens no HTML
-        html_content = self._embed_images_in_html(html_content, md_file_path)
+        # Embute imagens no HTML (opcional: o base_url já resolve os caminhos relativos)
+        if embed_images:
+            html_content = self._embed_images_in_html(html_content, md_file_path)
 
-        # Gera PDF
+        # Gera PDF em memória
         try:
-            HTML(string=html_content, base_url=str(md_file_path.parent)).write_pdf(
-                pdf_file_path,
-                stylesheets=[CSS(string=self.REPORT_CSS)]
+            pdf_bytes = HTML(string=html_content, base_url=str(md_file_path.parent)).write_pdf(
+                stylesheets=[self._css]
             )
-            return pdf_file_path
         except Exception as e:
             raise RuntimeError(f"Erro ao gerar PDF: {e}")
 
-    def generate_all_pdfs(self, source_dir: Path) -> list[Path]:
+        # Troca atômica: uma execução interrompida não deixa PDF corrompido
+        _atomic_write(pdf_file_path, pdf_bytes)
+
+        return pdf_file_path
+
+    def generate_all_pdfs(self, source_dir: Path, max_workers: Optional[int] = None,
+                          verbose: bool = True) -> list[Path]:
         """
         Gera PDFs para todos os arquivos .md em um diretório.
+        Cada arquivo é renderizado em um processo separado (o layout do
+        WeasyPrint é CPU-bound e não libera o GIL).
 
         Args:
             source_dir: Diretório contendo arquivos .md
+            max_workers: Número de processos (padrão: número de CPUs;
+                1 renderiza no processo atual)
+            verbose: Imprime cada PDF gerado (padrão: True); erros são sempre impressos
 
         Returns:
             Lista de caminhos dos PDFs gerados
@@ -290,12 +342,60 @@ class PDFGenerator:
 
         md_files = list(Path(source_dir).glob('*.md'))
 
-        for md_file in md_files:
-            try:
-                pdf_path = self.markdown_to_pdf(md_file)
-                pdf_files.append(pdf_path)
-                print(f"✓ PDF gerado: {pdf_path.name}")
-            except Exception as e:
-                print(f"✗ Erro ao gerar PDF de {md_file.name}: {e}")
+        if max_workers == 1 or len(md_files) <= 1:
+            results = (_try_render(self, md_file) for md_file in md_files)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            # Processos recebem o CSS desta instância (ou subclasse) como texto
+            n = len(md_files)
+            results = executor.map(_render_one, md_files, [self.output_dir] * n, [self.REPORT_CSS] * n)
+
+        try:
+            # Mensagens na ordem dos arquivos
+            for md_file, (pdf_path, error) in zip(md_files, results):
+                if error is None:
+                    pdf_files.append(pdf_path)
+                    if verbose:
+                        print(f"✓ PDF gerado: {pdf_path.name}")
+                else:
+                    print(f"✗ Erro ao gerar PDF de {md_file.name}: {error}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         return pdf_files
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Grava os bytes em um arquivo temporário e o renomeia para o destino."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _try_render(generator: PDFGenerator, md_file: Path) -> Tuple[Optional[Path], Optional[str]]:
+    """
+    Converte um arquivo Markdown, devolvendo o erro em vez de lançá-lo.
+
+    Returns:
+        Tupla (caminho do PDF, None) ou (None, mensagem de erro)
+    """
+    try:
+        return generator.markdown_to_pdf(md_file), None
+    except Exception as e:
+        return None, str(e)
+
+
+@lru_cache(maxsize=1)
+def _process_generator(output_dir: Path, css_string: str) -> PDFGenerator:
+    """PDFGenerator de cada processo, criado uma vez (Markdown e CSS reaproveitados)."""
+    return PDFGenerator(output_dir, css_string)
+
+
+def _render_one(md_file: Path, output_dir: Path, css_string: str) -> Tuple[Optional[Path], Optional[str]]:
+    """Renderiza um PDF em um processo do pool, com o CSS do gerador original."""
+    return _try_render(_process_generator(output_dir, css_string), md_file)
@@ -1,9 +1,49 @@
 """
 Gerador de relatórios em Markdown.
 """
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, List, TYPE_CHECKING
 from datetime import datetime
+import time
+
+if TYPE_CHECKING:
+    from domain.analysis_result import AnalysisResult
+
+
+# Colunas da tabela de frequências, na ordem em que aparecem no relatório
+_FREQ_COLUMNS = ('valor', 'freq_absoluta', 'freq_relativa', 'freq_acumulada')
+
+
+# Interpretação do coeficiente de variação (%): limite superior, texto da
+# tabela de dispersão e texto da interpretação
+_CV_BUCKETS = (
+    (15, "Dados muito homogêneos", "**muito homogêneos** (pouca dispersão)."),
+    (30, "Dados moderadamente homogêneos", "**moderadamente homogêneos**."),
+    (float('inf'), "Dados heterogêneos", "**heterogêneos** (alta dispersão)."),
+)
+
+
+def _cv_bucket(cv: float) -> tuple:
+    """Textos (tabela, interpretação) da faixa do coeficiente de variação."""
+    # A última faixa também cobre CV indefinido (NaN), como o antigo else
+    return next(((table, text) for limit, table, text in _CV_BUCKETS if cv < limit), _CV_BUCKETS[-1][1:])
+
+
+@lru_cache(maxsize=1)
+def _format_minute(minute: int) -> str:
+    """Data/hora (dd/mm/aaaa HH:MM) do minuto informado (segundos desde a época / 60)."""
+    return datetime.fromtimestamp(minute * 60).strftime('%d/%m/%Y %H:%M')
+
+
+def _analysis_timestamp() -> str:
+    """
+    Data da análise exibida nos relatórios.
+    O formato só vai até os minutos: o texto é formatado uma vez por minuto
+    e reaproveitado por todos os relatórios gerados nesse intervalo.
+    """
+    return _format_minute(int(time.time() // 60))
 
 
 class ReportGenerator:
@@ -20,7 +60,7 @@ class ReportGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def generate_variable_report(self, variable_name: str, variable_type: str,
-                                 analysis_result: Dict[str, Any],
+                                 analysis_result: 'AnalysisResult',
                                  chart_paths: List[Path]) -> Path:
         """
         Gera relatório individual para uma variável.
@@ -36,135 +76,134 @@ class ReportGenerator:
         """
         report_path = self.output_dir / f"{variable_name}_relatorio.md"
 
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(f"# Relatório de Análise: {variable_name}\n\n")
-            f.write(f"**Tipo de Variável:** {variable_type}\n\n")
-            f.write(f"**Data da Análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}\n\n")
-            f.write("---\n\n")
-
-            # Frequências
-            if 'frequencias' in analysis_result:
-                f.write("## 📊 Distribuição de Frequências\n\n")
-                freq_df = analysis_result['frequencias']
-
-                f.write("| Valor | Freq. Absoluta | Freq. Relativa | Freq. Acumulada |\n")
-                f.write("|-------|----------------|----------------|------------------|\n")
-
-                # Limita a 20 linhas
-                display_df = freq_df.head(20)
-                for _, row in display_df.iterrows():
-                    valor = row['valor']
-                    fa = row['freq_absoluta']
-                    fr = row['freq_relativa']
-                    fac = row['freq_acumulada']
-                    f.write(f"| {valor} | {fa} | {fr:.4f} ({fr*100:.2f}%) | {fac:.4f} |\n")
-
-                if len(freq_df) > 20:
-                    f.write(f"\n*Mostrando top 20 de {len(freq_df)} valores*\n")
-
-                f.write("\n")
-
-            # Moda (para nominais e binárias)
-            if 'moda' in analysis_result and 'tendencia_central' not in analysis_result:
-                f.write("## 📈 Medida de Tendência Central\n\n")
-                moda = analysis_result['moda']
-                if isinstance(moda, list):
-                    f.write(f"**Moda:** {', '.join(map(str, moda))}\n\n")
+        parts = [
+            f"# Relatório de Análise: {variable_name}\n\n",
+            f"**Tipo de Variável:** {variable_type}\n\n",
+            f"**Data da Análise:** {_analysis_timestamp()}\n\n",
+            "---\n\n",
+        ]
+
+        # Frequências
+        if analysis_result.frequencias is not None:
+            parts.append("## 📊 Distribuição de Frequências\n\n")
+            freq_df = analysis_result.frequencias
+
+            parts.append("| Valor | Freq. Absoluta | Freq. Relativa | Freq. Acumulada |\n")
+            parts.append("|-------|----------------|----------------|------------------|\n")
+
+            # Limita a 20 linhas
+            display_df = freq_df.head(20)
+            # Colunas convertidas de uma vez em listas (sem iterar célula a célula no pandas)
+            rows = zip(*(display_df[column].tolist() for column in _FREQ_COLUMNS))
+            parts.extend(
+                f"| {valor} | {fa} | {fr:.4f} ({fr*100:.2f}%) | {fac:.4f} |\n"
+                for valor, fa, fr, fac in rows
+            )
+
+            if len(freq_df) > 20:
+                parts.append(f"\n*Mostrando top 20 de {len(freq_df)} valores*\n")
+
+            parts.append("\n")
+
+        # Moda (para nominais e binárias)
+        if analysis_result.moda is not None and analysis_result.tendencia_central is None:
+            parts.append("## 📈 Medida de Tendência Central\n\n")
+            moda = analysis_result.moda
+            if isinstance(moda, list):
+                parts.append(f"**Moda:** {', '.join(map(str, moda))}\n\n")
+            else:
+                parts.append(f"**Moda:** {moda}\n\n")
+
+        # Proporções (para binárias)
+        if analysis_result.proporcoes is not None:
+            parts.append("## 📊 Proporções\n\n")
+            parts.extend(f"- **{key}:** {value}\n" for key, value in analysis_result.proporcoes.items())
+            parts.append("\n")
+
+        # Tendência Central (para numéricas)
+        if analysis_result.tendencia_central is not None:
+            parts.append("## 📈 Medidas de Tendência Central\n\n")
+            tc = analysis_result.tendencia_central
+
+            parts.append("| Medida | Valor |\n")
+            parts.append("|--------|-------|\n")
+            if tc['media'] is not None:
+                parts.append(f"| **Média** | {tc['media']:.4f} |\n")
+            if tc['mediana'] is not None:
+                parts.append(f"| **Mediana** | {tc['mediana']:.4f} |\n")
+            if tc['moda'] is not None:
+                if isinstance(tc['moda'], list):
+                    moda_str = ', '.join([f"{m:.4f}" if isinstance(m, (int, float)) else str(m)
+                                        for m in tc['moda']])
+                    parts.append(f"| **Moda** | {moda_str} |\n")
                 else:
-                    f.write(f"**Moda:** {moda}\n\n")
-
-            # Proporções (para binárias)
-            if 'proporcoes' in analysis_result:
-                f.write("## 📊 Proporções\n\n")
-                for key, value in analysis_result['proporcoes'].items():
-                    f.write(f"- **{key}:** {value}\n")
-                f.write("\n")
-
-            # Tendência Central (para numéricas)
-            if 'tendencia_central' in analysis_result:
-                f.write("## 📈 Medidas de Tendência Central\n\n")
-                tc = analysis_result['tendencia_central']
-
-                f.write("| Medida | Valor |\n")
-                f.write("|--------|-------|\n")
-                if tc['media'] is not None:
-                    f.write(f"| **Média** | {tc['media']:.4f} |\n")
-                if tc['mediana'] is not None:
-                    f.write(f"| **Mediana** | {tc['mediana']:.4f} |\n")
-                if tc['moda'] is not None:
-                    if isinstance(tc['moda'], list):
-                        moda_str = ', '.join([f"{m:.4f}" if isinstance(m, (int, float)) else str(m)
-                                            for m in tc['moda']])
-                        f.write(f"| **Moda** | {moda_str} |\n")
-                    else:
-                        f.write(f"| **Moda** | {tc['moda']} |\n")
-                f.write("\n")
-
-            # Separatrizes
-            if 'separatrizes' in analysis_result:
-                sep = analysis_result['separatrizes']
-
-                if sep.get('quartis'):
-                    f.write("## 📏 Separatrizes\n\n")
-                    f.write("### Quartis\n\n")
-                    f.write("| Quartil | Valor | Interpretação |\n")
-                    f.write("|---------|-------|---------------|\n")
-                    q1 = sep['quartis']['Q1']
-                    q2 = sep['quartis']['Q2']
-                    q3 = sep['quartis']['Q3']
-                    f.write(f"| Q1 (25%) | {q1:.4f} | 25% dos valores estão abaixo de {q1:.4f} |\n")
-                    f.write(f"| Q2 (50%) | {q2:.4f} | 50% dos valores estão abaixo de {q2:.4f} (mediana) |\n")
-                    f.write(f"| Q3 (75%) | {q3:.4f} | 75% dos valores estão abaixo de {q3:.4f} |\n")
-                    f.write("\n")
-
-            # Dispersão
-            if 'dispersao' in analysis_result:
-                f.write("## 📐 Medidas de Dispersão\n\n")
-                disp = analysis_result['dispersao']
-
-                f.write("| Medida | Valor | Interpretação |\n")
-                f.write("|--------|-------|---------------|\n")
-
-                if disp['amplitude'] is not None:
-                    f.write(f"| **Amplitude** | {disp['amplitude']:.4f} | Diferença entre máximo e mínimo |\n")
-
-                if disp['variancia'] is not None:
-                    f.write(f"| **Variância** | {disp['variancia']:.4f} | Medida de dispersão ao quadrado |\n")
-
-                if disp['desvio_padrao'] is not None:
-                    f.write(f"| **Desvio Padrão** | {disp['desvio_padrao']:.4f} | Dispersão média em relação à média |\n")
-
-                if disp['intervalo_interquartil'] is not None:
-                    f.write(f"| **IQR (Q3-Q1)** | {disp['intervalo_interquartil']:.4f} | Amplitude dos 50% centrais |\n")
-
-                if disp['coeficiente_variacao'] is not None:
-                    cv = disp['coeficiente_variacao']
-                    f.write(f"| **Coef. Variação** | {cv:.2f}% | ")
-                    if cv < 15:
-                        f.write("Dados muito homogêneos |\n")
-                    elif cv < 30:
-                        f.write("Dados moderadamente homogêneos |\n")
-                    else:
-                        f.write("Dados heterogêneos |\n")
-
-                f.write("\n")
-
-            # Interpretação
-            f.write("## 💡 Interpretação\n\n")
-            f.write(self._generate_interpretation(variable_type, analysis_result))
-            f.write("\n")
-
-            # Gráficos
-            if chart_paths:
-                f.write("## 📊 Visualizações\n\n")
-                for chart_path in chart_paths:
-                    chart_name = chart_path.stem.replace(f"{variable_name}_", "").replace("_", " ").title()
-                    f.write(f"### {chart_name}\n\n")
-                    f.write(f"![{chart_name}]({chart_path.name})\n\n")
+                    parts.append(f"| **Moda** | {tc['moda']} |\n")
+            parts.append("\n")
+
+        # Separatrizes
+        if analysis_result.separatrizes is not None:
+            sep = analysis_result.separatrizes
+
+            if sep.get('quartis'):
+                q1 = sep['quartis']['Q1']
+                q2 = sep['quartis']['Q2']
+                q3 = sep['quartis']['Q3']
+                parts.append(
+                    "## 📏 Separatrizes\n\n"
+                    "### Quartis\n\n"
+                    "| Quartil | Valor | Interpretação |\n"
+                    "|---------|-------|---------------|\n"
+                    f"| Q1 (25%) | {q1:.4f} | 25% dos valores estão abaixo de {q1:.4f} |\n"
+                    f"| Q2 (50%) | {q2:.4f} | 50% dos valores estão abaixo de {q2:.4f} (mediana) |\n"
+                    f"| Q3 (75%) | {q3:.4f} | 75% dos valores estão abaixo de {q3:.4f} |\n"
+                    "\n"
+                )
+
+        # Dispersão
+        if analysis_result.dispersao is not None:
+            parts.append("## 📐 Medidas de Dispersão\n\n")
+            disp = analysis_result.dispersao
+
+            parts.append("| Medida | Valor | Interpretação |\n")
+            parts.append("|--------|-------|---------------|\n")
+
+            if disp['amplitude'] is not None:
+                parts.append(f"| **Amplitude** | {disp['amplitude']:.4f} | Diferença entre máximo e mínimo |\n")
+
+            if disp['variancia'] is not None:
+                parts.append(f"| **Variância** | {disp['variancia']:.4f} | Medida de dispersão ao quadrado |\n")
+
+            if disp['desvio_padrao'] is not None:
+                parts.append(f"| **Desvio Padrão** | {disp['desvio_padrao']:.4f} | Dispersão média em relação à média |\n")
+
+            if disp['intervalo_interquartil'] is not None:
+                parts.append(f"| **IQR (Q3-Q1)** | {disp['intervalo_interquartil']:.4f} | Amplitude dos 50% centrais |\n")
+
+            if disp['coeficiente_variacao'] is not None:
+                cv = disp['coeficiente_variacao']
+                parts.append(f"| **Coef. Variação** | {cv:.2f}% | {_cv_bucket(cv)[0]} |\n")
+
+            parts.append("\n")
+
+        # Interpretação
+        parts.append("## 💡 Interpretação\n\n")
+        parts.append(self._generate_interpretation(variable_type, analysis_result))
+        parts.append("\n")
+
+        # Gráficos
+        if chart_paths:
+            parts.append("## 📊 Visualizações\n\n")
+            for chart_path in chart_paths:
+                chart_name = chart_path.stem.replace(f"{variable_name}_", "").replace("_", " ").title()
+                parts.append(f"### {chart_name}\n\n")
+                parts.append(f"![{chart_name}]({chart_path.name})\n\n")
+
+        # Uma única escrita no arquivo
+        report_path.write_text("".join(parts), encoding='utf-8')
 
         return report_path
 
-    def _generate_interpretation(self, variable_type: str, analysis_result: Dict[str, Any]) -> str:
+    def _generate_interpretation(self, variable_type: str, analysis_result: 'AnalysisResult') -> str:
         """
         Gera interpretação automática baseada nos resultados.
 
@@ -178,22 +217,22 @@ class ReportGenerator:
         interpretation = []
 
         if variable_type == "Nominal":
-            if 'moda' in analysis_result:
-                moda = analysis_result['moda']
+            if analysis_result.moda is not None:
+                moda = analysis_result.moda
                 if isinstance(moda, list):
                     interpretation.append(f"- As categorias mais frequentes são: **{', '.join(map(str, moda))}**")
                 else:
                     interpretation.append(f"- A categoria mais frequente é: **{moda}**")
 
         elif variable_type == "Binária":
-            if 'proporcoes' in analysis_result:
-                props = analysis_result['proporcoes']
+            if analysis_result.proporcoes is not None:
+                props = analysis_result.proporcoes
                 for key, value in props.items():
                     interpretation.append(f"- **{key}** representa {value} dos dados")
 
         elif variable_type in ["Discreta", "Contínua"]:
-            tc = analysis_result.get('tendencia_central', {})
-            disp = analysis_result.get('dispersao', {})
+            tc = analysis_result.tendencia_central or {}
+            disp = analysis_result.dispersao or {}
 
             # Média vs Mediana
             if tc.get('media') and tc.get('mediana'):
@@ -210,12 +249,7 @@ class ReportGenerator:
             # Coeficiente de Variação
             if disp.get('coeficiente_variacao'):
                 cv = disp['coeficiente_variacao']
-                if cv < 15:
-                    interpretation.append(f"- Com **CV = {cv:.2f}%**, os dados são **muito homogêneos** (pouca dispersão).")
-                elif cv < 30:
-                    interpretation.append(f"- Com **CV = {cv:.2f}%**, os dados são **moderadamente homogêneos**.")
-                else:
-                    interpretation.append(f"- Com **CV = {cv:.2f}%**, os dados são **heterogêneos** (alta dispersão).")
+                interpretation.append(f"- Com **CV = {cv:.2f}%**, os dados são {_cv_bucket(cv)[1]}")
 
             # IQR
             if disp.get('intervalo_interquartil') and tc.get('mediana'):
@@ -226,7 +260,8 @@ class ReportGenerator:
         return '\n'.join(interpretation) if interpretation else "Análise concluída com sucesso."
 
     def generate_dataset_report(self, dataset_name: str, variables_summary: List[Dict],
-                               summary_chart_path: Path = None) -> Path:
+                               summary_chart_path: Path = None,
+                               grouped_boxplot_path: Path = None) -> Path:
         """
         Gera relatório geral do dataset.
 
@@ -234,60 +269,65 @@ class ReportGenerator:
             dataset_name: Nome do dataset
             variables_summary: Lista com resumo das variáveis
             summary_chart_path: Caminho do gráfico resumo
+            grouped_boxplot_path: Caminho dos boxplots agrupados das variáveis numéricas
 
         Returns:
             Caminho do relatório gerado
         """
         report_path = self.output_dir / "RELATORIO_GERAL.md"
 
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(f"# Relatório de Análise Estatística Descritiva\n\n")
-            f.write(f"## Dataset: {dataset_name}\n\n")
-            f.write(f"**Data da Análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}\n\n")
-            f.write("---\n\n")
-
-            # Resumo Geral
-            f.write("## 📊 Resumo Geral\n\n")
-            f.write(f"- **Total de variáveis:** {len(variables_summary)}\n")
-
-            if variables_summary:
-                total_records = variables_summary[0]['total_valores']
-                f.write(f"- **Total de registros:** {total_records}\n\n")
-
-                # Contagem por tipo
-                from collections import Counter
-                types_count = Counter([v['tipo'] for v in variables_summary])
-
-                f.write("### Distribuição por Tipo de Variável\n\n")
-                f.write("| Tipo | Quantidade |\n")
-                f.write("|------|------------|\n")
-                for tipo, count in sorted(types_count.items()):
-                    f.write(f"| {tipo} | {count} |\n")
-                f.write("\n")
-
-            # Tabela de Variáveis
-            f.write("## 📋 Detalhamento das Variáveis\n\n")
-            f.write("| Variável | Tipo | Total Valores | Valores Únicos | Valores Faltantes |\n")
-            f.write("|----------|------|---------------|----------------|-------------------|\n")
-
-            for var in variables_summary:
-                f.write(f"| {var['nome']} | {var['tipo']} | {var['total_valores']} | ")
-                f.write(f"{var['valores_unicos']} | {var['valores_faltantes']} |\n")
-
-            f.write("\n")
-
-            # Gráfico Resumo
-            if summary_chart_path and summary_chart_path.exists():
-                f.write("## 📊 Visualização Geral\n\n")
-                f.write(f"![Resumo do Dataset]({summary_chart_path.name})\n\n")
-
-            # Links para relatórios individuais
-            f.write("## 📄 Relatórios Individuais\n\n")
-            for var in variables_summary:
-                var_name = var['nome']
-                f.write(f"- [{var_name}]({var_name}_relatorio.md)\n")
-
-            f.write("\n---\n\n")
-            f.write("*Relatório gerado automaticamente pelo Sistema de Análise de Estatística Descritiva*\n")
+        parts = [
+            "# Relatório de Análise Estatística Descritiva\n\n",
+            f"## Dataset: {dataset_name}\n\n",
+            f"**Data da Análise:** {_analysis_timestamp()}\n\n",
+            "---\n\n",
+        ]
+
+        # Resumo Geral
+        parts.append("## 📊 Resumo Geral\n\n")
+        parts.append(f"- **Total de variáveis:** {len(variables_summary)}\n")
+
+        if variables_summary:
+            total_records = variables_summary[0]['total_valores']
+            parts.append(f"- **Total de registros:** {total_records}\n\n")
+
+            # Contagem por tipo
+            types_count = Counter(v['tipo'] for v in variables_summary)
+
+            parts.append("### Distribuição por Tipo de Variável\n\n")
+            parts.append("| Tipo | Quantidade |\n")
+            parts.append("|------|------------|\n")
+            parts.extend(f"| {tipo} | {count} |\n" for tipo, count in sorted(types_count.items()))
+            parts.append("\n")
+
+        # Tabela de Variáveis
+        parts.append("## 📋 Detalhamento das Variáveis\n\n")
+        parts.append("| Variável | Tipo | Total Valores | Valores Únicos | Valores Faltantes |\n")
+        parts.append("|----------|------|---------------|----------------|-------------------|\n")
+        parts.extend(
+            f"| {var['nome']} | {var['tipo']} | {var['total_valores']} | "
+            f"{var['valores_unicos']} | {var['valores_faltantes']} |\n"
+            for var in variables_summary
+        )
+        parts.append("\n")
+
+        # Gráfico Resumo
+        if summary_chart_path and summary_chart_path.exists():
+            parts.append("## 📊 Visualização Geral\n\n")
+            parts.append(f"![Resumo do Dataset]({summary_chart_path.name})\n\n")
+
+        if grouped_boxplot_path and grouped_boxplot_path.exists():
+            parts.append("### Distribuição das Variáveis Numéricas\n\n")
+            parts.append(f"![Boxplots das Variáveis Numéricas]({grouped_boxplot_path.name})\n\n")
+
+        # Links para relatórios individuais
+        parts.append("## 📄 Relatórios Individuais\n\n")
+        parts.extend(f"- [{var['nome']}]({var['nome']}_relatorio.md)\n" for var in variables_summary)
+
+        parts.append("\n---\n\n")
+        parts.append("*Relatório gerado automaticamente pelo Sistema de Análise de Estatística Descritiva*\n")
+
+        # Uma única escrita no arquivo
+        report_path.write_text("".join(parts), encoding='utf-8')
 
         return report_path
@@ -2,60 +2,100 @@
 Sistema de Análise de Estatística Descritiva
 Arquitetura refatorada com padrões Factory e Strategy
 """
+import argparse
 import os
-import sys
-from data_loading.factory import create_reader, load_implementations
+from data_loading.factory import create_reader
 from domain.dataset import DataSet
+from analysis.statistical_functions import ENGINES
+
+# Arquivos CSV maiores que este tamanho são analisados em streaming (em partes)
+STREAMING_THRESHOLD_BYTES = 512 * 1024 * 1024
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Lê os argumentos da linha de comando.
+
+    Args:
+        argv: Lista de argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Argumentos lidos
+    """
+    parser = argparse.ArgumentParser(description="Sistema de Análise de Estatística Descritiva")
+    parser.add_argument("file_path", nargs="?", help="Arquivo CSV ou XLSX a analisar")
+    parser.add_argument("--engine", choices=ENGINES, default="pandas",
+                        help="Engine das estatísticas numéricas (padrão: pandas)")
+    parser.add_argument("--float32", action="store_true",
+                        help="Converte colunas decimais para float32 (menos memória, menos precisão)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Não imprime análises e progresso (apenas erros); útil em execuções em lote")
+    parser.add_argument("--cache-dir",
+                        help="Guarda os gráficos nesta pasta (subpasta descriptive-statistics-charts) e os "
+                             "reaproveita nas próximas execuções; sem esta opção nada é guardado")
+    return parser.parse_args(argv)
 
 
 def main():
     """Função principal do sistema."""
 
-    load_implementations()
+    args = parse_args()
+    # Banner e progresso só fora do modo --quiet (erros são sempre impressos)
+    log = (lambda *a, **k: None) if args.quiet else print
 
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
+    if args.file_path:
+        file_path = args.file_path
     else:
         file_path = "teste.csv"
-        print("💡 Dica: Você pode passar um arquivo como argumento:")
-        print("   python src/main.py seu_arquivo.csv\n")
+        log("💡 Dica: Você pode passar um arquivo como argumento:")
+        log("   python src/main.py seu_arquivo.csv\n")
 
-    if not os.path.exists(file_path):
+    # Um único stat: existência agora, tamanho na escolha do modo streaming
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
         print(f"❌ Erro: Arquivo '{file_path}' não encontrado.")
         return
 
-    _, extensao = os.path.splitext(file_path)
-    file_type = extensao[1:].lower()
+    # Extensão pelo último ponto do nome do arquivo (sem considerar diretórios)
+    file_name = os.path.basename(file_path)
+    stem, _, extensao = file_name.rpartition('.')
+    file_type = extensao.lower() if stem else ''
 
     if not file_type:
         print("❌ Erro: Arquivo sem extensão.")
         return
 
-    print(f"\n🔄 Carregando arquivo: {file_path}")
-    print(f"📄 Tipo de arquivo: {file_type.upper()}")
+    log(f"\n🔄 Carregando arquivo: {file_path}")
+    log(f"📄 Tipo de arquivo: {file_type.upper()}")
 
     try:
-        reader = create_reader(file_type, file_path)
+        reader = create_reader(file_type, file_path, downcast_floats=args.float32)
+
+        if hasattr(reader, 'iter_chunks') and file_size > STREAMING_THRESHOLD_BYTES:
+            analyze_streaming(reader, file_name, verbose=not args.quiet)
+            return
 
         df = reader.read()
 
-        print(f"✅ Arquivo carregado com sucesso!")
-        print(f"📊 Dimensões: {df.shape[0]} linhas x {df.shape[1]} colunas")
+        log(f"✅ Arquivo carregado com sucesso!")
+        log(f"📊 Dimensões: {df.shape[0]} linhas x {df.shape[1]} colunas")
 
-        dataset = DataSet(df, name=os.path.basename(file_path))
+        dataset = DataSet(df, name=file_name, engine=args.engine,
+                          verbose=not args.quiet)
 
         dataset.print_summary()
 
         dataset.analyze_all_variables()
 
         # Exporta gráficos e relatórios
-        print("\n" + "="*60)
-        print("Gerando visualizações e relatórios...")
-        print("="*60)
+        log("\n" + "="*60)
+        log("Gerando visualizações e relatórios...")
+        log("="*60)
 
         try:
-            output_dir = dataset.export_all(generate_charts=True)
-            print(f"\n✨ Visualizações e relatórios salvos em: {output_dir.absolute()}")
+            output_dir = dataset.export_all(generate_charts=True, cache_dir=args.cache_dir)
+            log(f"\n✨ Visualizações e relatórios salvos em: {output_dir.absolute()}")
         except Exception as export_error:
             print(f"\n⚠️  Erro ao gerar visualizações: {export_error}")
             import traceback
@@ -71,5 +111,29 @@ def main():
         traceback.print_exc()
 
 
+def analyze_streaming(reader, name: str, verbose: bool = True):
+    """
+    Analisa um arquivo grande em partes, sem carregar todas as linhas.
+    Gráficos e PDFs não são gerados neste modo.
+
+    Args:
+        reader: Leitor com suporte a iter_chunks
+        name: Nome do dataset
+        verbose: Imprime progresso e o resumo (padrão: True)
+    """
+    from analysis.streaming import StreamingAggregator
+
+    if verbose:
+        print("📦 Arquivo grande: análise em streaming (sem gráficos e PDFs)")
+
+    aggregator = StreamingAggregator()
+    for chunk in reader.iter_chunks():
+        aggregator.update(chunk)
+
+    if verbose:
+        print("✅ Arquivo processado com sucesso!")
+        aggregator.print_summary(name)
+
+
 if __name__ == "__main__":
     main()
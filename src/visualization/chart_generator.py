@@ -1,37 +1,357 @@
 """
 Gerador de gráficos para diferentes tipos de variáveis.
 """
-import matplotlib.pyplot as plt
+import functools
+import hashlib
+import json
+import os
+import shutil
+import matplotlib
+matplotlib.use('Agg')  # Backend não interativo: os gráficos só são salvos em arquivo
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 import warnings
+from analysis.statistical_functions import drop_missing_values
+
+if TYPE_CHECKING:
+    from domain.analysis_result import AnalysisResult
 
 warnings.filterwarnings('ignore')
 
 # Configuração de estilo
 sns.set_theme(style="whitegrid")
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['font.size'] = 10
+matplotlib.rcParams['figure.figsize'] = (10, 6)
+matplotlib.rcParams['font.size'] = 10
+
+
+def _auto_histogram(values: np.ndarray, iqr: Optional[float],
+                    density: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Histograma com as mesmas classes de bins='auto' do NumPy 2 (menor largura
+    entre Sturges e Freedman-Diaconis, este limitado a metade da largura da
+    regra da raiz), usando o IQR já calculado na análise em vez de
+    recalcular os percentis sobre os dados.
+
+    Args:
+        values: Valores sem faltantes
+        iqr: Intervalo interquartil (None para calcular)
+        density: Normaliza as contagens para que a área total seja 1
+
+    Returns:
+        Tupla (contagens, limites das classes)
+    """
+    n = values.size
+    low, high = values.min(), values.max()
+    span = high - low
+
+    if span > 0:
+        width = span / (np.log2(n) + 1.0)
+        if iqr is None:
+            iqr = float(np.subtract(*np.percentile(values, [75, 25])))
+        fd_width = max(2.0 * iqr * n ** (-1 / 3), span / np.sqrt(n) / 2)
+        width = min(width, fd_width)
+        bins = int(np.ceil(span / width))
+        return np.histogram(values, bins=bins, range=(low, high), density=density)
+
+    # Todos os valores iguais: uma classe de largura 1 (como o NumPy)
+    return np.histogram(values, bins=1, density=density)
+
+
+# Abaixo deste tamanho a KDE é avaliada diretamente;
+# acima, é calculada sobre o histograma com convolução via FFT
+_KDE_DIRECT_MAX = 500
+_KDE_GRID_SIZE = 512
+
+
+def _kde_curve(values: np.ndarray,
+               view: Optional[Tuple[float, float]] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Curva de densidade (KDE gaussiana, largura de banda pela regra de Scott,
+    a mesma do gaussian_kde) entre o mínimo e o máximo dos dados, ou só no
+    intervalo visível (view) quando informado.
+
+    Para muitos valores, os dados são agrupados em _KDE_GRID_SIZE classes e
+    a soma dos núcleos vira uma convolução (O(N + B log B) em vez de O(N·B)).
+
+    Args:
+        values: Valores sem faltantes
+        view: Intervalo (início, fim) onde avaliar a curva (opcional)
+
+    Returns:
+        Tupla (x, densidade) ou None se os dados não tiverem variação
+    """
+    n = values.size
+    std = values.std(ddof=1) if n > 1 else 0.0
+    if not std > 0:
+        return None
+
+    low, high = values.min(), values.max()
+    if view is not None:
+        low, high = max(low, view[0]), min(high, view[1])
+    bandwidth = std * n ** (-1 / 5)
+
+    if n < _KDE_DIRECT_MAX:
+        # Poucos valores: soma direta dos núcleos em uma única operação
+        # vetorizada (matriz 200 x n, no máximo 100 mil elementos)
+        xs = np.linspace(low, high, 200)
+        z = (xs[:, None] - values[None, :]) / bandwidth
+        density = np.exp(-0.5 * z * z).sum(axis=1) / (n * bandwidth * np.sqrt(2 * np.pi))
+        return xs, density
+
+    from scipy.signal import fftconvolve
+
+    # A grade cobre o intervalo visível mais 4 larguras de banda de cada lado:
+    # valores além disso não alcançam a curva (o núcleo é truncado em 4 larguras)
+    lo_margin = min(4 * bandwidth, low - values.min())
+    hi_margin = min(4 * bandwidth, values.max() - high)
+    counts, edges = np.histogram(values, bins=_KDE_GRID_SIZE,
+                                 range=(low - lo_margin, high + hi_margin))
+    step = edges[1] - edges[0]
+
+    # Núcleo gaussiano nas mesmas distâncias da grade (até 4 larguras de banda)
+    half = min(int(np.ceil(4 * bandwidth / step)), _KDE_GRID_SIZE - 1)
+    offsets = np.arange(-half, half + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+
+    density = fftconvolve(counts, kernel, mode='same') / (n * bandwidth * np.sqrt(2 * np.pi))
+    centers = (edges[:-1] + edges[1:]) / 2
+    visible = (centers >= low) & (centers <= high)
+    # A FFT pode deixar resíduos negativos minúsculos onde não há dados
+    return centers[visible], np.maximum(density[visible], 0)
+
+
+# Máximo de pontos individuais desenhados sobre o boxplot
+_STRIP_MAX_POINTS = 20_000
+
+
+def _subsample(values: np.ndarray, max_points: int = _STRIP_MAX_POINTS) -> np.ndarray:
+    """
+    Amostra aleatória (semente fixa, reprodutível) de no máximo max_points
+    valores, para desenhar os pontos individuais de colunas grandes.
+
+    Args:
+        values: Valores sem faltantes
+        max_points: Tamanho máximo da amostra
+
+    Returns:
+        Os próprios valores ou uma amostra sem reposição
+    """
+    if values.size <= max_points:
+        return values
+    return np.random.default_rng(0).choice(values, size=max_points, replace=False)
+
+
+def _warm_up():
+    """
+    Desenha uma figura mínima para carregar as fontes (normal e negrito) e o
+    backend Agg uma única vez na importação. Processos filhos criados depois
+    (fork) herdam esse estado e o primeiro gráfico de cada um não espera.
+    """
+    figure = Figure(figsize=(1, 1))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.text(0, 0, ' ')
+    ax.set_title(' ', fontweight='bold')
+    figure.canvas.draw()
+
+
+_warm_up()
+
+
+# Cores convertidas para RGBA uma única vez (sem interpretar as strings a cada gráfico)
+_BINARY_COLORS = matplotlib.colors.to_rgba_array(['#66b3ff', '#ff9999'])
+_NOMINAL_COLOR = matplotlib.colors.to_rgba('steelblue')
+
+
+# Versão do desenho dos gráficos: incrementar ao mudar a aparência
+# invalida os gráficos guardados em cache
+_CHART_CACHE_VERSION = 4
+_CACHE_MANIFEST = 'manifest.json'
+# Sufixos das pastas temporárias de _store_in_cache ('.<variável>.<pid>.tmp/.old')
+_CACHE_TEMP_SUFFIXES = ('.tmp', '.old')
+
+
+def _is_cache_entry(entry: Path) -> bool:
+    """Indica se a pasta foi criada pelo cache (entrada com manifesto ou temporária)."""
+    if not entry.is_dir() or entry.is_symlink():
+        return False
+    if entry.name.startswith('.') and entry.name.endswith(_CACHE_TEMP_SUFFIXES):
+        return True
+    return (entry / _CACHE_MANIFEST).is_file()
+
+
+def _cached_charts(method):
+    """
+    Reaproveita os gráficos de uma variável já gerados para os mesmos dados
+    (cache em ChartGenerator.cache_dir), sem renderizar de novo.
+
+    Cada variável ocupa uma única entrada (pasta com o nome da variável),
+    substituída quando os dados ou o desenho mudam: o cache não acumula
+    gráficos antigos.
+    """
+    @functools.wraps(method)
+    def wrapper(self: 'ChartGenerator', data: pd.Series, variable_name: str,
+                analysis_result: 'AnalysisResult') -> list:
+        if self.cache_dir is None:
+            return method(self, data, variable_name, analysis_result)
+
+        key = self._cache_key(method.__name__, data, variable_name)
+        charts = self._from_cache(variable_name, key)
+        if charts is None:
+            charts = method(self, data, variable_name, analysis_result)
+            self._store_in_cache(variable_name, key, charts)
+        return charts
+
+    return wrapper
 
 
 class ChartGenerator:
-    """Gerador de gráficos estatísticos."""
+    """
+    Gerador de gráficos estatísticos.
+
+    Todos os gráficos são desenhados na mesma Figure, limpa entre um
+    gráfico e outro (sem criar e destruir uma figura por gráfico).
+    Por isso uma instância não deve ser usada por várias threads ao mesmo tempo.
+    """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, dpi: int = 150, cache_dir: Optional[Path] = None):
         """
         Inicializa o gerador de gráficos.
 
         Args:
             output_dir: Diretório onde os gráficos serão salvos
+            dpi: Resolução dos PNGs (150 basta para os relatórios; 300 para impressão)
+            cache_dir: Diretório persistente com os gráficos já gerados, pelo
+                hash dos dados (opcional; sem ele todo gráfico é renderizado)
         """
         self.output_dir = output_dir
+        self.dpi = dpi
+        self.cache_dir = cache_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._figure: Optional[Figure] = None
+
+    def _new_chart(self, figsize: Tuple[float, float], ncols: int = 1, nrows: int = 1,
+                   height_ratios: Optional[list] = None):
+        """
+        Prepara a figura reaproveitada para o próximo gráfico.
+
+        Args:
+            figsize: Tamanho da figura em polegadas
+            ncols: Número de eixos lado a lado
+            nrows: Número de eixos empilhados
+            height_ratios: Alturas relativas das linhas (opcional)
+
+        Returns:
+            Eixo (ou array de eixos se houver mais de um)
+        """
+        # Figure fora do pyplot: não fica registrada no estado global e já
+        # nasce com o canvas Agg (savefig não troca de canvas a cada PNG)
+        if self._figure is None:
+            self._figure = Figure()
+            FigureCanvasAgg(self._figure)
+
+        self._figure.clear()
+        self._figure.set_size_inches(figsize)
+        return self._figure.subplots(nrows, ncols, height_ratios=height_ratios)
+
+    def _save(self, chart_path: Path) -> Path:
+        """
+        Ajusta o layout, salva o gráfico e libera os elementos desenhados.
+        O formato vem da extensão: .svg (vetorial) para os gráficos de barras
+        e pizza, .png para histogramas, densidade e boxplots.
+        """
+        # tight_layout já ajusta as margens: sem bbox_inches='tight' (um render a menos)
+        self._figure.tight_layout()
+        self._figure.savefig(chart_path, dpi=self.dpi)
+        self._figure.clear()
+        return chart_path
+
+    def _cache_key(self, method_name: str, data: pd.Series, variable_name: str) -> str:
+        """
+        Chave do cache: versão do desenho, tipo de gráfico, nome, resolução e
+        hash dos dados (as medidas da análise são derivadas dos mesmos dados).
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{_CHART_CACHE_VERSION}|{method_name}|{variable_name}|{self.dpi}|{data.dtype}".encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _from_cache(self, variable_name: str, key: str) -> Optional[list]:
+        """Copia os gráficos guardados para output_dir (None se a entrada não for desta chave)."""
+        entry = self.cache_dir / variable_name
+        try:
+            manifest = json.loads((entry / _CACHE_MANIFEST).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get('key') != key:
+            return None
+
+        charts = []
+        for name in manifest['charts']:
+            chart_path = self.output_dir / name
+            shutil.copyfile(entry / name, chart_path)
+            charts.append(chart_path)
+        return charts
+
+    def _store_in_cache(self, variable_name: str, key: str, charts: list):
+        """
+        Guarda os gráficos gerados e o manifesto (chave e nomes) em uma pasta
+        temporária que substitui a entrada anterior da variável no final:
+        leitores nunca veem uma entrada incompleta.
+        """
+        entry = self.cache_dir / variable_name
+        tmp_entry = self.cache_dir / f".{variable_name}.{os.getpid()}.tmp"
+        old_entry = self.cache_dir / f".{variable_name}.{os.getpid()}.old"
+        try:
+            tmp_entry.mkdir(parents=True, exist_ok=True)
+            for chart_path in charts:
+                shutil.copyfile(chart_path, tmp_entry / chart_path.name)
+            manifest = {'key': key, 'charts': [chart_path.name for chart_path in charts]}
+            (tmp_entry / _CACHE_MANIFEST).write_text(json.dumps(manifest), encoding='utf-8')
+
+            # Entrada anterior (dados ou desenho antigos) sai do caminho e é apagada;
+            # uma pasta que não foi criada pelo cache nunca é substituída
+            if entry.exists():
+                if not _is_cache_entry(entry):
+                    return
+                os.replace(entry, old_entry)
+            os.replace(tmp_entry, entry)
+        except OSError:
+            # Cache não gravável: os gráficos já estão em output_dir
+            pass
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            shutil.rmtree(old_entry, ignore_errors=True)
+
+    def prune_cache(self, variable_names):
+        """
+        Remove do cache as entradas de variáveis que não estão mais no dataset
+        (e restos de gravações interrompidas). Apenas pastas criadas pelo
+        cache são apagadas: outros arquivos em cache_dir ficam intactos.
 
+        Args:
+            variable_names: Nomes (sanitizados) das variáveis exportadas
+        """
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return
+
+        keep = set(variable_names)
+        for entry in self.cache_dir.iterdir():
+            if entry.name not in keep and _is_cache_entry(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def close(self):
+        """Libera a figura reaproveitada (recriada se um novo gráfico for gerado)."""
+        self._figure = None
+
+    @_cached_charts
     def generate_for_nominal(self, data: pd.Series, variable_name: str,
-                            analysis_result: Dict[str, Any]) -> list:
+                            analysis_result: 'AnalysisResult') -> list:
         """
         Gera gráficos para variável nominal.
         - Gráfico de barras (frequências)
@@ -47,9 +367,9 @@ class ChartGenerator:
         charts = []
 
         # Gráfico de Barras - Frequências
-        fig, ax = plt.subplots(figsize=(12, 6))
+        ax = self._new_chart((12, 6))
 
-        freq_df = analysis_result['frequencias']
+        freq_df = analysis_result.frequencias
 
         # Limita a 15 categorias para não poluir o gráfico
         if len(freq_df) > 15:
@@ -58,7 +378,7 @@ class ChartGenerator:
         else:
             title_suffix = ""
 
-        bars = ax.bar(range(len(freq_df)), freq_df['freq_absoluta'], color='steelblue', alpha=0.8)
+        bars = ax.bar(range(len(freq_df)), freq_df['freq_absoluta'], color=_NOMINAL_COLOR, alpha=0.8)
         ax.set_xlabel('Categorias', fontsize=12, fontweight='bold')
         ax.set_ylabel('Frequência Absoluta', fontsize=12, fontweight='bold')
         ax.set_title(f'Distribuição de Frequências - {variable_name}{title_suffix}',
@@ -68,22 +388,16 @@ class ChartGenerator:
         ax.grid(axis='y', alpha=0.3)
 
         # Adiciona valores sobre as barras
-        for i, bar in enumerate(bars):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontsize=9)
-
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_barras.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.bar_label(bars, fmt='%d', fontsize=9)
+
+        chart_path = self._save(self.output_dir / f"{variable_name}_barras.svg")
         charts.append(chart_path)
 
         return charts
 
+    @_cached_charts
     def generate_for_binary(self, data: pd.Series, variable_name: str,
-                           analysis_result: Dict[str, Any]) -> list:
+                           analysis_result: 'AnalysisResult') -> list:
         """
         Gera gráficos para variável binária.
         - Gráfico de pizza (proporções)
@@ -98,12 +412,12 @@ class ChartGenerator:
             Lista de caminhos dos gráficos gerados
         """
         charts = []
-        freq_df = analysis_result['frequencias']
+        freq_df = analysis_result.frequencias
 
         # Gráfico de Pizza
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        ax1, ax2 = self._new_chart((14, 6), ncols=2)
 
-        colors = ['#66b3ff', '#ff9999']
+        colors = _BINARY_COLORS
         explode = (0.05, 0)
 
         ax1.pie(freq_df['freq_absoluta'], labels=freq_df['valor'], autopct='%1.1f%%',
@@ -118,22 +432,16 @@ class ChartGenerator:
         ax2.grid(axis='y', alpha=0.3)
 
         # Adiciona valores sobre as barras
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center', va='bottom', fontsize=11)
-
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_proporcoes.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax2.bar_label(bars, fmt='%d', fontsize=11)
+
+        chart_path = self._save(self.output_dir / f"{variable_name}_proporcoes.svg")
         charts.append(chart_path)
 
         return charts
 
+    @_cached_charts
     def generate_for_discrete(self, data: pd.Series, variable_name: str,
-                             analysis_result: Dict[str, Any]) -> list:
+                             analysis_result: 'AnalysisResult') -> list:
         """
         Gera gráficos para variável discreta.
         - Histograma
@@ -149,46 +457,50 @@ class ChartGenerator:
             Lista de caminhos dos gráficos gerados
         """
         charts = []
-        data_clean = data.dropna()
+        # Valores sem faltantes convertidos uma única vez para um array float64
+        values = np.asarray(drop_missing_values(data), dtype=np.float64)
 
         # 1. Histograma + Curva de Densidade
-        fig, ax = plt.subplots(figsize=(12, 6))
+        ax = self._new_chart((12, 6))
 
-        ax.hist(data_clean, bins='auto', color='skyblue', alpha=0.7,
-               edgecolor='black', label='Frequência')
+        counts, edges = _auto_histogram(values,
+                                        analysis_result.dispersao['intervalo_interquartil'])
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue',
+               alpha=0.7, edgecolor='black', label='Frequência')
         ax.set_xlabel('Valores', fontsize=12, fontweight='bold')
         ax.set_ylabel('Frequência', fontsize=12, fontweight='bold')
         ax.set_title(f'Histograma - {variable_name}', fontsize=14, fontweight='bold', pad=20)
         ax.grid(axis='y', alpha=0.3)
 
         # Adiciona linha vertical para média e mediana
-        mean = analysis_result['tendencia_central']['media']
-        median = analysis_result['tendencia_central']['mediana']
+        mean = analysis_result.tendencia_central['media']
+        median = analysis_result.tendencia_central['mediana']
         ax.axvline(mean, color='red', linestyle='--', linewidth=2, label=f'Média: {mean:.2f}')
         ax.axvline(median, color='green', linestyle='--', linewidth=2, label=f'Mediana: {median:.2f}')
 
-        ax.legend()
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_histograma.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # Histograma primeiro na legenda (containers de barras vêm por último)
+        handles, labels = ax.get_legend_handles_labels()
+        ax.legend(handles[-1:] + handles[:-1], labels[-1:] + labels[:-1])
+        chart_path = self._save(self.output_dir / f"{variable_name}_histograma.png")
         charts.append(chart_path)
 
         # 2. Boxplot com pontos individuais
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._new_chart((10, 6))
 
-        bp = ax.boxplot([data_clean], vert=True, patch_artist=True,
-                        labels=[variable_name], widths=0.5)
+        bp = ax.boxplot([values], vert=True, patch_artist=True,
+                        tick_labels=[variable_name], widths=0.5)
 
         # Colorir o boxplot
         for patch in bp['boxes']:
             patch.set_facecolor('lightblue')
             patch.set_alpha(0.7)
 
-        # Adiciona pontos individuais (strip plot)
+        # Adiciona pontos individuais (strip plot), amostrados em colunas grandes:
+        # o boxplot e as medidas continuam calculados sobre todos os valores
+        points = _subsample(values)
         # Adiciona jitter (ruído horizontal) para ver pontos sobrepostos
-        x_positions = np.random.normal(1, 0.04, size=len(data_clean))
-        ax.scatter(x_positions, data_clean, alpha=0.4, s=30, color='navy',
+        x_positions = np.random.normal(1, 0.04, size=points.size)
+        ax.scatter(x_positions, points, alpha=0.4, s=30, color='navy',
                   edgecolors='darkblue', linewidth=0.5, zorder=3,
                   label='Dados individuais')
 
@@ -199,29 +511,26 @@ class ChartGenerator:
         ax.legend(loc='upper right')
 
         # Adiciona informações estatísticas
-        q1 = analysis_result['separatrizes']['quartis']['Q1']
-        q2 = analysis_result['separatrizes']['quartis']['Q2']
-        q3 = analysis_result['separatrizes']['quartis']['Q3']
+        q1 = analysis_result.separatrizes['quartis']['Q1']
+        q2 = analysis_result.separatrizes['quartis']['Q2']
+        q3 = analysis_result.separatrizes['quartis']['Q3']
 
-        text_info = f'Q1: {q1:.2f}\nQ2: {q2:.2f}\nQ3: {q3:.2f}\nn = {len(data_clean)}'
+        text_info = f'Q1: {q1:.2f}\nQ2: {q2:.2f}\nQ3: {q3:.2f}\nn = {values.size}'
         ax.text(1.15, q2, text_info, fontsize=10,
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_boxplot.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        chart_path = self._save(self.output_dir / f"{variable_name}_boxplot.png")
         charts.append(chart_path)
 
         return charts
 
+    @_cached_charts
     def generate_for_continuous(self, data: pd.Series, variable_name: str,
-                               analysis_result: Dict[str, Any]) -> list:
+                               analysis_result: 'AnalysisResult') -> list:
         """
-        Gera gráficos para variável contínua.
+        Gera gráficos para variável contínua, em uma única figura.
         - Histograma com curva de densidade
         - Boxplot
-        - QQ-plot (para verificar normalidade)
 
         Args:
             data: Série de dados
@@ -232,19 +541,30 @@ class ChartGenerator:
             Lista de caminhos dos gráficos gerados
         """
         charts = []
-        data_clean = data.dropna()
+        # Valores sem faltantes convertidos uma única vez para um array float64
+        values = np.asarray(drop_missing_values(data), dtype=np.float64)
+
+        # Histograma (em cima) e boxplot (embaixo) na mesma figura:
+        # um único layout e um único savefig por variável
+        ax, ax_box = self._new_chart((12, 11), nrows=2, height_ratios=[6, 5])
 
         # 1. Histograma + Curva de Densidade KDE
-        fig, ax = plt.subplots(figsize=(12, 6))
 
-        ax.hist(data_clean, bins='auto', color='skyblue', alpha=0.6,
-               edgecolor='black', density=True, label='Frequência')
+        counts, edges = _auto_histogram(values,
+                                        analysis_result.dispersao['intervalo_interquartil'],
+                                        density=True)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue',
+               alpha=0.6, edgecolor='black', label='Frequência')
 
         # Adiciona curva de densidade
-        from scipy import stats
-        density = stats.gaussian_kde(data_clean)
-        xs = np.linspace(data_clean.min(), data_clean.max(), 200)
-        ax.plot(xs, density(xs), 'r-', linewidth=2, label='Densidade (KDE)')
+        # Curva só no intervalo visível [Q1 - 3·IQR, Q3 + 3·IQR]: as caudas
+        # dos outliers têm densidade praticamente nula
+        quartis = analysis_result.separatrizes['quartis']
+        iqr = analysis_result.dispersao['intervalo_interquartil']
+        view = (quartis['Q1'] - 3 * iqr, quartis['Q3'] + 3 * iqr) if iqr is not None and iqr > 0 else None
+        curve = _kde_curve(values, view)
+        if curve is not None:
+            ax.plot(*curve, 'r-', linewidth=2, label='Densidade (KDE)')
 
         ax.set_xlabel('Valores', fontsize=12, fontweight='bold')
         ax.set_ylabel('Densidade', fontsize=12, fontweight='bold')
@@ -252,35 +572,34 @@ class ChartGenerator:
                     fontsize=14, fontweight='bold', pad=20)
 
         # Adiciona linha vertical para média e mediana
-        mean = analysis_result['tendencia_central']['media']
-        median = analysis_result['tendencia_central']['mediana']
+        mean = analysis_result.tendencia_central['media']
+        median = analysis_result.tendencia_central['mediana']
         ax.axvline(mean, color='darkred', linestyle='--', linewidth=2,
                   label=f'Média: {mean:.2f}')
         ax.axvline(median, color='darkgreen', linestyle='--', linewidth=2,
                   label=f'Mediana: {median:.2f}')
 
-        ax.legend()
+        # Histograma primeiro na legenda (containers de barras vêm por último)
+        handles, labels = ax.get_legend_handles_labels()
+        ax.legend(handles[-1:] + handles[:-1], labels[-1:] + labels[:-1])
         ax.grid(alpha=0.3)
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_histograma_densidade.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        charts.append(chart_path)
 
         # 2. Boxplot Horizontal com pontos individuais
-        fig, ax = plt.subplots(figsize=(12, 5))
+        ax = ax_box
 
-        bp = ax.boxplot([data_clean], vert=False, patch_artist=True,
-                        labels=[variable_name], widths=0.5)
+        bp = ax.boxplot([values], vert=False, patch_artist=True,
+                        tick_labels=[variable_name], widths=0.5)
 
         for patch in bp['boxes']:
             patch.set_facecolor('lightcoral')
             patch.set_alpha(0.7)
 
-        # Adiciona pontos individuais (strip plot horizontal)
+        # Adiciona pontos individuais (strip plot horizontal), amostrados em
+        # colunas grandes: o boxplot e as medidas usam todos os valores
+        points = _subsample(values)
         # Adiciona jitter (ruído vertical) para ver pontos sobrepostos
-        y_positions = np.random.normal(1, 0.04, size=len(data_clean))
-        ax.scatter(data_clean, y_positions, alpha=0.4, s=30, color='darkred',
+        y_positions = np.random.normal(1, 0.04, size=points.size)
+        ax.scatter(points, y_positions, alpha=0.4, s=30, color='darkred',
                   edgecolors='maroon', linewidth=0.5, zorder=3,
                   label='Dados individuais')
 
@@ -291,20 +610,17 @@ class ChartGenerator:
         ax.legend(loc='upper right')
 
         # Adiciona informações
-        q1 = analysis_result['separatrizes']['quartis']['Q1']
-        q2 = analysis_result['separatrizes']['quartis']['Q2']
-        q3 = analysis_result['separatrizes']['quartis']['Q3']
-        iqr = analysis_result['dispersao']['intervalo_interquartil']
+        q1 = analysis_result.separatrizes['quartis']['Q1']
+        q2 = analysis_result.separatrizes['quartis']['Q2']
+        q3 = analysis_result.separatrizes['quartis']['Q3']
+        iqr = analysis_result.dispersao['intervalo_interquartil']
 
-        text_info = f'Q1: {q1:.2f} | Q2: {q2:.2f} | Q3: {q3:.2f}\nIQR: {iqr:.2f} | n = {len(data_clean)}'
+        text_info = f'Q1: {q1:.2f} | Q2: {q2:.2f} | Q3: {q3:.2f}\nIQR: {iqr:.2f} | n = {values.size}'
         ax.text(0.02, 0.95, text_info, transform=ax.transAxes, fontsize=10,
                verticalalignment='top',
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-        plt.tight_layout()
-        chart_path = self.output_dir / f"{variable_name}_boxplot.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        chart_path = self._save(self.output_dir / f"{variable_name}_histograma_boxplot.png")
         charts.append(chart_path)
 
         return charts
@@ -323,25 +639,32 @@ class ChartGenerator:
         if not variables_summary:
             return None
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        ax1, ax2 = self._new_chart((14, 6), ncols=2)
 
         # Gráfico 1: Distribuição de Tipos de Variáveis
-        from collections import Counter
-        types_count = Counter([v['tipo'] for v in variables_summary])
-
-        ax1.bar(types_count.keys(), types_count.values(), color='steelblue', alpha=0.8)
+        # Cada tipo recebe um código na ordem em que aparece; as contagens
+        # saem de um único np.bincount sobre os códigos
+        type_codes = {}
+        codes = np.fromiter((type_codes.setdefault(v['tipo'], len(type_codes)) for v in variables_summary),
+                            dtype=np.intp, count=len(variables_summary))
+        type_counts = np.bincount(codes)
+
+        type_bars = ax1.bar(list(type_codes), type_counts, color=_NOMINAL_COLOR, alpha=0.8)
         ax1.set_xlabel('Tipo de Variável', fontsize=12, fontweight='bold')
         ax1.set_ylabel('Quantidade', fontsize=12, fontweight='bold')
         ax1.set_title('Distribuição de Tipos de Variáveis', fontsize=14, fontweight='bold', pad=20)
         ax1.grid(axis='y', alpha=0.3)
 
-        for i, (k, v) in enumerate(types_count.items()):
-            ax1.text(i, v, str(v), ha='center', va='bottom', fontsize=11, fontweight='bold')
+        ax1.bar_label(type_bars, fmt='%d', fontsize=11, fontweight='bold')
 
         # Gráfico 2: Valores Faltantes por Variável
-        names = [v['nome'][:15] + '...' if len(v['nome']) > 15 else v['nome']
-                for v in variables_summary]
-        missing = [v['valores_faltantes'] for v in variables_summary]
+        # Nomes com mais de 15 caracteres são truncados com '...', em
+        # operações vetorizadas sobre o array de nomes
+        names_arr = np.array([v['nome'] for v in variables_summary], dtype=str)
+        truncated = np.char.add(names_arr.astype('<U15'), '...')
+        names = np.where(np.char.str_len(names_arr) > 15, truncated, names_arr).tolist()
+        missing = np.fromiter((v['valores_faltantes'] for v in variables_summary),
+                              dtype=np.int64, count=len(variables_summary))
 
         bars = ax2.barh(names, missing, color='coral', alpha=0.8)
         ax2.set_xlabel('Valores Faltantes', fontsize=12, fontweight='bold')
@@ -349,16 +672,41 @@ class ChartGenerator:
         ax2.set_title('Valores Faltantes por Variável', fontsize=14, fontweight='bold', pad=20)
         ax2.grid(axis='x', alpha=0.3)
 
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            if width > 0:
-                ax2.text(width, bar.get_y() + bar.get_height()/2.,
-                        f'{int(width)}',
-                        ha='left', va='center', fontsize=9)
+        # Só variáveis com faltantes recebem rótulo
+        ax2.bar_label(bars, labels=np.where(missing > 0, missing.astype(str), '').tolist(), fontsize=9)
 
-        plt.tight_layout()
-        chart_path = self.output_dir / f"_resumo_dataset.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        chart_path = self._save(self.output_dir / "_resumo_dataset.svg")
 
         return chart_path
+
+    def generate_grouped_boxplots(self, series_dict: Dict[str, np.ndarray]) -> Optional[Path]:
+        """
+        Gera os boxplots de todas as variáveis numéricas lado a lado,
+        em uma única figura (visão geral das distribuições do dataset).
+
+        Args:
+            series_dict: Nome da variável -> valores (sem faltantes)
+
+        Returns:
+            Caminho do gráfico gerado ou None se não houver variáveis numéricas
+        """
+        arrays = [np.asarray(values, dtype=np.float64) for values in series_dict.values()]
+        if not arrays:
+            return None
+
+        ax = self._new_chart((max(12, len(arrays) * 0.6), 6))
+
+        # Um único boxplot com todas as variáveis; outliers omitidos para não
+        # desenhar cada ponto extremo de todas as colunas
+        bp = ax.boxplot(arrays, patch_artist=True, tick_labels=list(series_dict),
+                        widths=0.5, showfliers=False)
+        for patch in bp['boxes']:
+            patch.set_facecolor('lightblue')
+            patch.set_alpha(0.7)
+
+        ax.set_ylabel('Valores', fontsize=12, fontweight='bold')
+        ax.set_title('Boxplots das Variáveis Numéricas', fontsize=14, fontweight='bold', pad=20)
+        ax.grid(axis='y', alpha=0.3)
+        ax.tick_params(axis='x', labelrotation=45)
+
+        return self._save(self.output_dir / "_boxplots_agrupados.png")